@@ -1,6 +1,21 @@
 from functools import total_ordering
-from assignment1 import FloorGraph, restaurantFinder
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import random
+from assignment1 import BACKENDS, backend_report, get_backend, CSRFloorGraph, FloorGraph, SearchContext, restaurantFinder, restaurantFinder_stream, restaurantFinder_batch, \
+    restaurantFinder_sweep, RestaurantSolver, restaurantFinder_positions, restaurantFinder_file, write_site_file, \
+    convert_sites_to_binary, restaurantFinder_parallel, restaurantFinder_many, \
+    RestaurantCache, RestaurantWhatIf, RestaurantPlanner, restaurantFinder_plans, \
+    restaurantFinder_budget, restaurantFinder_sparse, restaurantFinder_radii
+from assignment1 import benchmark
 import unittest
+import os
+import tempfile
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 class TestRestaurantFinder(unittest.TestCase):
 
@@ -286,6 +301,625 @@ class TestRestaurantFinder(unittest.TestCase):
         site_list = [5,3,2,10,7,12,1]
         self.assertEqual(restaurantFinder(4, site_list), (17, [1,6]))
 
+class TestRestaurantFinderStream(unittest.TestCase):
+
+    def test_1(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        for d in range(12):
+            self.assertEqual(restaurantFinder_stream(d, iter(site_list)), restaurantFinder(d, site_list))
+
+    def test_2(self):
+        site_list = [50, -10, 12, -65, -40, 95, -100, 12, -20, -30]
+        revenues = (revenue for revenue in site_list)
+        self.assertEqual(restaurantFinder_stream(1, revenues), (169, [1, 3, 6, 8]))
+
+    def test_3(self):
+        self.assertEqual(restaurantFinder_stream(2, []), (0, []))
+
+class TestRestaurantFinderBatch(unittest.TestCase):
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_1(self):
+        revenue_matrix = [[50, 10, 12, 65, 40, 95, 100, 12, 20, 30],
+                          [50, -10, 12, -65, -40, 95, -100, 12, -20, -30],
+                          [50, -10, -12, -65, -40, -95, -100, -12, -20, 30],
+                          [0, 0, 0, 0, 0, 0, 0, 0, 0, 0]]
+        for d in range(12):
+            totals, sites = restaurantFinder_batch(d, revenue_matrix)
+            for s, site_list in enumerate(revenue_matrix):
+                self.assertEqual((totals[s], sites[s]), restaurantFinder(d, site_list))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_2(self):
+        totals, sites = restaurantFinder_batch(1, np.array([[1000, 900, 1000, 2000], [2, 1, 3, 9]]))
+        self.assertEqual(totals.tolist(), [3000, 11])
+        self.assertEqual(sites, [[1, 4], [1, 4]])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_3(self):
+        revenue_matrix = [[2 ** 62] * 3, [2 ** 62, -5, 2 ** 62], [1, 2, 3]]
+        for d in range(3):
+            totals, sites = restaurantFinder_batch(d, revenue_matrix)
+            self.assertEqual(list(zip(totals.tolist(), sites)), [restaurantFinder(d, row) for row in revenue_matrix])
+        self.assertEqual(get_backend('numpy').restaurantFinder(0, [2 ** 62] * 3), (3 * 2 ** 62, [1, 2, 3]))
+
+class TestRestaurantFinderSweep(unittest.TestCase):
+
+    def test_1(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        sweep = restaurantFinder_sweep(12, site_list)
+        self.assertEqual(sweep.revenues, [434, 252, 245, 175, 150, 150, 100, 100, 100, 100, 100, 100, 100])
+        for d in range(13):
+            self.assertEqual((sweep.revenues[d], sweep.sites(d)), restaurantFinder(d, site_list))
+
+    def test_2(self):
+        site_list = [50, -10, 12, -65, -40, 95, -100, 12, -20, -30]
+        sweep = restaurantFinder_sweep(3, site_list)
+        self.assertEqual(sweep.sites(1), [1, 3, 6, 8])
+        with self.assertRaises(IndexError):
+            sweep.sites(4)
+
+    def test_3(self):
+        for site_list in ([2 ** 62] * 3, [2 ** 62, -5, 2 ** 62, 2 ** 61]):
+            sweep = restaurantFinder_sweep(4, site_list)
+            for d in range(5):
+                self.assertEqual((sweep.revenues[d], sweep.sites(d)), restaurantFinder(d, site_list))
+
+class TestRestaurantSolver(unittest.TestCase):
+
+    def test_1(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        for d in range(12):
+            solver = RestaurantSolver(d, site_list)
+            self.assertEqual((solver.best(), solver.sites()), restaurantFinder(d, site_list))
+
+    def test_2(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        solver = RestaurantSolver(1, site_list)
+        updates = [(1, -50), (7, 5), (10, 0), (2, 70), (6, -95)]
+        for i, revenue in updates:
+            solver.update(i, revenue)
+            site_list[i - 1] = revenue
+            self.assertEqual((solver.best(), solver.sites()), restaurantFinder(1, site_list))
+
+    def test_3(self):
+        solver = RestaurantSolver(2, [5])
+        self.assertEqual(solver.best(), 5)
+        solver.update(1, -5)
+        self.assertEqual((solver.best(), solver.sites()), (0, []))
+        with self.assertRaises(IndexError):
+            solver.update(2, 1)
+
+    def test_4(self):
+        site_list = [5, 3, 2, 10, 7, 12, 1, 50, -10, 12, -65, -40, 95, -100]
+        for d in range(5):
+            solver = RestaurantSolver(d, site_list)
+            for l in range(1, len(site_list) + 1):
+                for r in range(l, len(site_list) + 1):
+                    total, sites = restaurantFinder(d, site_list[l - 1:r])
+                    self.assertEqual(solver.query(l, r), total)
+                    self.assertEqual(solver.query_sites(l, r), (total, [site + l - 1 for site in sites]))
+
+    def test_5(self):
+        solver = RestaurantSolver(1, [5, 3, 2, 10, 7, 12, 1])
+        self.assertEqual(solver.query_many([(1, 7), (2, 5), (4, 4), (5, 4)]), [27, 13, 10, 0])
+        solver.update(4, 0)
+        self.assertEqual(solver.query_many([(1, 7), (2, 5)]), [19, 10])
+
+    def test_6(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30, 5, 3, 2, 10, 7, 12, 1, 50, -10, 12, -65, -40, 95, -100]
+        ranges = [(l, r) for l in range(1, 25, 3) for r in range(24, l - 3, -2)] + [(3, 9), (3, 9), (24, 24)]
+        for d in range(5):
+            solver = RestaurantSolver(d, site_list)
+            self.assertEqual(solver.query_many(iter(ranges)), [solver.query(l, r) for l, r in ranges])
+        with self.assertRaises(IndexError):
+            solver.query_many([(1, 3), (0, 4)])
+
+class TestRestaurantFinderPositions(unittest.TestCase):
+
+    def test_1(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        sites = [(i + 1, revenue) for i, revenue in enumerate(site_list)]
+        for d in range(12):
+            self.assertEqual(restaurantFinder_positions(d, sites), restaurantFinder(d, site_list))
+
+    def test_2(self):
+        sites = [(12.5, 40), (0.0, 30), (3.2, 25), (5.0, 10), (8.1, 45), (9.0, 20)]
+        self.assertEqual(restaurantFinder_positions(3, sites), (140, [2, 3, 5, 1]))
+        self.assertEqual(restaurantFinder_positions(4, sites), (115, [2, 5, 1]))
+        self.assertEqual(restaurantFinder_positions(0, [(2, 5), (2, 7)]), (7, [2]))
+        self.assertEqual(restaurantFinder_positions(1, []), (0, []))
+
+class TestRestaurantFinderMaxSites(unittest.TestCase):
+
+    def test_1(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        self.assertEqual(restaurantFinder(1, site_list, max_sites=5), (252, [1, 4, 6, 8, 10]))
+        self.assertEqual(restaurantFinder(1, site_list, max_sites=3), (215, [1, 4, 7]))
+        self.assertEqual(restaurantFinder(1, site_list, max_sites=1), (100, [7]))
+        self.assertEqual(restaurantFinder(1, site_list, max_sites=0), (0, []))
+
+    def test_2(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        total_revenue, selected_sites = restaurantFinder(0, site_list, max_sites=4)
+        self.assertEqual(total_revenue, 310)
+        self.assertEqual(sorted(selected_sites, key=lambda site: site_list[site - 1]), [1, 4, 6, 7])
+
+    def test_3(self):
+        self.assertEqual(restaurantFinder(1, [1000, 900, 1000, 2000], max_sites=1), (2000, [4]))
+        self.assertEqual(restaurantFinder(1, [4, 4, 4, 4, 4], max_sites=2), (8, [1, 3]))
+
+    def test_4(self):
+        with self.assertRaises(TypeError):
+            restaurantFinder(1, [1.5, 2.25, 1.5], max_sites=1)
+        with self.assertRaises(TypeError):
+            restaurantFinder(1, [4, 4.0], max_sites=5)
+        self.assertEqual(restaurantFinder(1, [1.5, 2.25, 1.5]), (3.0, [1, 3]))
+
+class TestRestaurantFinderFile(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'sites.bin')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_1(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        self.assertEqual(write_site_file(self.path, iter(site_list)), 10)
+        for d in range(12):
+            self.assertEqual(restaurantFinder_file(d, self.path), restaurantFinder(d, site_list))
+
+    def test_2(self):
+        csv_path = os.path.join(self.directory.name, 'sites.csv')
+        with open(csv_path, 'w') as file:
+            file.write("50,-10,12\n-65,-40\n95\n-100,12,-20,-30\n")
+        self.assertEqual(convert_sites_to_binary(csv_path, self.path), 10)
+        self.assertEqual(restaurantFinder_file(1, self.path), (169, [1, 3, 6, 8]))
+
+    def test_3(self):
+        json_path = os.path.join(self.directory.name, 'sites.json')
+        with open(json_path, 'w') as file:
+            file.write("[1000, 900, 1000, 2000]")
+        self.assertEqual(convert_sites_to_binary(json_path, self.path), 4)
+        self.assertEqual(restaurantFinder_file(1, self.path), (3000, [1, 4]))
+
+    def test_4(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a site file')
+        with self.assertRaises(ValueError):
+            restaurantFinder_file(1, self.path)
+
+    def test_5(self):
+        write_site_file(self.path, [1000, 900, 1000, 2000])
+        with self.assertRaises(TypeError) as raised:
+            restaurantFinder_file('x', self.path)
+        self.assertIsNone(raised.exception.__context__)
+        self.assertEqual(restaurantFinder_file(1, self.path), (3000, [1, 4]))
+
+class TestRestaurantFinderParallel(unittest.TestCase):
+
+    def test_1(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30, 5, 3, 2, 10, 7, 12, 1, 50, -10, 12, -65, -40, 95, -100] * 3
+        for d in range(6):
+            for chunk_size in (1, 4, 9, 16, 25):
+                self.assertEqual(restaurantFinder_parallel(d, site_list, workers=8, chunk_size=chunk_size),
+                                 restaurantFinder(d, site_list))
+
+    def test_2(self):
+        self.assertEqual(restaurantFinder_parallel(1, [1, 2 ** 70, 3, 4, 5, 1, 2], workers=8, chunk_size=4),
+                         (2 ** 70 + 7, [2, 5, 7]))
+        self.assertEqual(restaurantFinder_parallel(3, [5], workers=2), (5, [1]))
+
+    def test_3(self):
+        # The matrices would need (d+1)^2 = 2.5e9 totals, so this only finishes if it falls back to restaurantFinder
+        site_list = [(site * 7919) % 2001 - 1000 for site in range(100000)]
+        self.assertEqual(restaurantFinder_parallel(50000, site_list, workers=2 ** 20),
+                         restaurantFinder(50000, site_list))
+        self.assertEqual(restaurantFinder_parallel(3, site_list, workers=4), restaurantFinder(3, site_list))
+
+class TestRestaurantFinderMany(unittest.TestCase):
+
+    def test_1(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        jobs = [(d, site_list) for d in range(12)] + [(1, [1000, 900, 1000, 2000]), (10, [100, 1, 1000])]
+        expected = [restaurantFinder(d, site_list) for d, site_list in jobs]
+        self.assertEqual(list(restaurantFinder_many(jobs, workers=2, batch_size=3)), expected)
+        self.assertEqual(list(restaurantFinder_many(iter(jobs), workers=1)), expected)
+
+    def test_2(self):
+        self.assertEqual(list(restaurantFinder_many([], workers=2)), [])
+
+class TestRestaurantCache(unittest.TestCase):
+
+    def test_1(self):
+        cache = RestaurantCache()
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        self.assertEqual(cache.restaurantFinder(1, site_list), (252, [1, 4, 6, 8, 10]))
+        total_revenue, selected_sites = cache.restaurantFinder(1, list(site_list))
+        selected_sites.append(11)
+        self.assertEqual(cache.restaurantFinder(1, site_list), (252, [1, 4, 6, 8, 10]))
+        self.assertEqual(cache.restaurantFinder(2, site_list), (245, [1, 4, 7, 10]))
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['evictions']), (2, 2, 0))
+
+    def test_2(self):
+        cache = RestaurantCache(max_bytes=400)
+        site_list = [5, 3, 2, 10, 7, 12, 1]
+        for d in range(4):
+            cache.restaurantFinder(d, site_list)
+        self.assertEqual(cache.stats()['evictions'], 2)
+        self.assertEqual(cache.restaurantFinder(3, site_list), (17, [1, 6]))
+        self.assertEqual(cache.restaurantFinder(0, site_list), (40, [1, 2, 3, 4, 5, 6, 7]))
+        self.assertEqual((cache.hits, cache.misses), (1, 5))
+
+    def test_3(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.sqlite')
+            cache = RestaurantCache(path=path)
+            cache.restaurantFinder(1, [1000, 900, 1000, 2000])
+            cache.close()
+            cache = RestaurantCache(path=path)
+            self.assertEqual(cache.restaurantFinder(1, [1000, 900, 1000, 2000]), (3000, [1, 4]))
+            self.assertEqual(cache.restaurantFinder(1, [1000, 900, 1000, 2000]), (3000, [1, 4]))
+            self.assertEqual((cache.disk_hits, cache.hits, cache.misses), (1, 1, 0))
+            cache.close()
+
+class TestRestaurantWhatIf(unittest.TestCase):
+
+    def test_1(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        what_if = RestaurantWhatIf(1, site_list)
+        self.assertEqual(what_if.optimum, 252)
+        self.assertEqual(what_if.forced_in(7), 245)
+        self.assertEqual(what_if.forced_out(4), 232)
+        self.assertEqual(what_if.forced_out(3), 252)
+        self.assertEqual(what_if.threshold(7), 107)
+        self.assertEqual(what_if.threshold(4), 45)
+
+    def test_2(self):
+        site_list = [5, 3, 2, 10, 7, 12, 1]
+        for d in range(4):
+            what_if = RestaurantWhatIf(d, site_list)
+            for site, forced_in, forced_out, threshold in what_if.report():
+                edited = list(site_list)
+                edited[site - 1] = float('-inf')
+                self.assertEqual(forced_out, restaurantFinder(d, edited)[0])
+                self.assertEqual(max(forced_in, forced_out), what_if.optimum)
+                self.assertEqual(threshold, forced_out - forced_in + site_list[site - 1])
+
+    def test_3(self):
+        what_if = RestaurantWhatIf(1, [50, 10, 12, 65])
+        for site in (0, -1, 5):
+            for query in (what_if.forced_in, what_if.forced_out, what_if.threshold):
+                with self.assertRaises(IndexError):
+                    query(site)
+        self.assertEqual(what_if.forced_in(4), 115)
+
+class TestRestaurantPlanner(unittest.TestCase):
+
+    def test_1(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        for d in range(12):
+            planner = RestaurantPlanner(d)
+            for i, revenue in enumerate(site_list):
+                planner.append(revenue)
+                self.assertEqual((planner.best(), planner.sites()), restaurantFinder(d, site_list[:i + 1]))
+
+    def test_2(self):
+        planner = RestaurantPlanner(1)
+        self.assertEqual((planner.best(), planner.sites(), len(planner)), (0, [], 0))
+        planner.extend([50, -10, 12, -65])
+        planner.extend([-40, 95, -100, 12, -20, -30])
+        self.assertEqual((planner.best(), planner.sites(), len(planner)), (169, [1, 3, 6, 8], 10))
+
+class TestRestaurantFinderPlans(unittest.TestCase):
+
+    def test_1(self):
+        plans = list(itertools.islice(restaurantFinder_plans(1, [1000, 900, 1000, 2000]), 4))
+        self.assertEqual(plans[:2], [(3000, [1, 4]), (2900, [2, 4])])
+        self.assertEqual(sorted(plans[2:]), [(2000, [1, 3]), (2000, [4])])
+
+    def test_2(self):
+        site_list = [5, 3, 2, 10, 7, 12, 1]
+        plans = list(restaurantFinder_plans(2, site_list))
+        self.assertEqual(plans[0], restaurantFinder(2, site_list))
+        self.assertEqual(len(plans), len(set(tuple(sites) for _, sites in plans)))
+        self.assertEqual(len(plans), 19)
+        for (total_revenue, sites), (next_revenue, _) in zip(plans, plans[1:]):
+            self.assertGreaterEqual(total_revenue, next_revenue)
+        for total_revenue, sites in plans:
+            self.assertEqual(total_revenue, sum(site_list[site - 1] for site in sites))
+            self.assertTrue(all(later - earlier > 2 for earlier, later in zip(sites, sites[1:])))
+
+    def test_3(self):
+        plans = list(restaurantFinder_plans(0, [0, 0]))
+        self.assertEqual(plans[0], (0, []))
+        self.assertEqual(sorted(sites for _, sites in plans), [[], [1], [1, 2], [2]])
+
+    def test_4(self):
+        site_list = [4, -2, 7, 0, 3, -1, 6, 2]
+        for d in range(4):
+            expected = []
+            for chosen in itertools.product([False, True], repeat=len(site_list)):
+                sites = [site for site in range(1, len(site_list) + 1) if chosen[site - 1]]
+                if all(later - earlier > d for earlier, later in zip(sites, sites[1:])):
+                    expected.append((sum(site_list[site - 1] for site in sites), sites))
+            plans = list(restaurantFinder_plans(d, site_list))
+            self.assertEqual(sorted(plans), sorted(expected))
+            self.assertEqual([total for total, _ in plans], sorted((total for total, _ in plans), reverse=True))
+
+class TestRestaurantFinderBudget(unittest.TestCase):
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_1(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        costs = [0] * len(site_list)
+        for d in range(12):
+            self.assertEqual(restaurantFinder_budget(d, site_list, costs, 0), restaurantFinder(d, site_list))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_2(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        costs = [5, 1, 1, 6, 2, 9, 12, 1, 2, 3]
+        self.assertEqual(restaurantFinder_budget(1, site_list, costs, 100), (252, [1, 4, 6, 8, 10]))
+        self.assertEqual(restaurantFinder_budget(1, site_list, costs, 20), (212, [2, 4, 6, 8, 10]))
+        self.assertEqual(restaurantFinder_budget(1, site_list, costs, 2), (40, [5]))
+        self.assertEqual(restaurantFinder_budget(1, site_list, costs, 0), (0, []))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_3(self):
+        total_revenue, chosen_sites = restaurantFinder_budget(1, [], [], 5)
+        self.assertEqual((total_revenue, chosen_sites), (0, []))
+        self.assertIs(type(total_revenue), int)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_4(self):
+        self.assertEqual(restaurantFinder_budget(0, [2**62] * 3, [0, 0, 0], 1), (3 * 2**62, [1, 2, 3]))
+        self.assertEqual(restaurantFinder_budget(1, [2**62] * 3, [1, 0, 1], 2), (2**63, [1, 3]))
+
+class TestRestaurantFinderSparse(unittest.TestCase):
+
+    def test_1(self):
+        site_list = [50, -10, 12, -65, -40, 95, -100, 12, -20, -30]
+        sites = [(i + 1, revenue) for i, revenue in enumerate(site_list) if revenue > 0]
+        for d in range(12):
+            self.assertEqual(restaurantFinder_sparse(d, sites, len(site_list)), restaurantFinder(d, site_list))
+
+    def test_2(self):
+        sites = [(1000000, 30), (1, 50), (999998, 40), (500000, 5)]
+        self.assertEqual(restaurantFinder_sparse(1, sites, 1000000), (125, [1, 500000, 999998, 1000000]))
+        self.assertEqual(restaurantFinder_sparse(2, sites, 1000000), (95, [1, 500000, 999998]))
+        self.assertEqual(restaurantFinder_sparse(2, [], 10), (0, []))
+        with self.assertRaises(IndexError):
+            restaurantFinder_sparse(2, [(11, 5)], 10)
+
+class TestRestaurantFinderRadii(unittest.TestCase):
+
+    def test_1(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        for d in range(12):
+            self.assertEqual(restaurantFinder_radii(site_list, [d] * len(site_list))[0],
+                             restaurantFinder(d, site_list)[0])
+
+    def test_2(self):
+        site_list = [50, 10, 12, 65, 40, 95, 100, 12, 20, 30]
+        radii = [0, 0, 0, 0, 0, 4, 0, 0, 0, 0]
+        self.assertEqual(restaurantFinder_radii(site_list, radii), (339, [1, 2, 3, 4, 5, 7, 8, 9, 10]))
+        radii = [0, 0, 0, 0, 0, 0, 6, 0, 0, 0]
+        self.assertEqual(restaurantFinder_radii(site_list, radii), (334, [1, 2, 3, 4, 5, 6, 8, 9, 10]))
+        self.assertEqual(restaurantFinder_radii([-5, -3], [0, 0]), (0, []))
+
+class TestBackends(unittest.TestCase):
+
+    def test_1(self):
+        site_list = [50, -10, 12, -65, -40, 95, -100, 12, -20, -30]
+        for name in BACKENDS:
+            if not backend_report()['backends'][name]['available']:
+                continue
+            backend = get_backend(name)
+            for d in range(12):
+                self.assertEqual(backend.restaurantFinder(d, site_list), restaurantFinder(d, site_list))
+            graph = backend.FloorGraph([(0, 1, 4), (0, 3, 2), (0, 2, 3), (2, 3, 2), (3, 0, 3)],
+                                       [(0, 5), (3, 2), (1, 3)])
+            self.assertEqual(graph.climb(0, [1, 2]), (7, [0, 1]))
+
+    def test_2(self):
+        previous = os.environ.pop('ASSIGNMENT1_BACKEND', None)
+        try:
+            self.assertEqual(get_backend().name, 'reference')
+            os.environ['ASSIGNMENT1_BACKEND'] = 'array'
+            self.assertEqual(get_backend().name, 'array')
+            self.assertEqual(get_backend('reference').name, 'reference')
+            self.assertEqual(backend_report()['default'], 'array')
+            with self.assertRaises(KeyError):
+                get_backend('missing')
+        finally:
+            os.environ.pop('ASSIGNMENT1_BACKEND', None)
+            if previous is not None:
+                os.environ['ASSIGNMENT1_BACKEND'] = previous
+
+    def test_3(self):
+        self.assertEqual(restaurantFinder(1, []), (0, []))
+        self.assertEqual(restaurantFinder(1, [], max_sites=0), (0, []))
+        for name in BACKENDS:
+            if not backend_report()['backends'][name]['available']:
+                continue
+            total_revenue, chosen_sites = get_backend(name).restaurantFinder(1, [])
+            self.assertEqual((total_revenue, chosen_sites), (0, []))
+            self.assertIs(type(total_revenue), int)
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_1(self):
+        for pattern in benchmark.PATTERNS:
+            result = benchmark.run_case('reference', pattern, 200, seed=7, repeat=1)
+            generate, distance = benchmark.PATTERNS[pattern]
+            site_list = generate(200, benchmark.random.Random(7))
+            self.assertEqual(site_list, generate(200, benchmark.random.Random(7)))
+            self.assertEqual(site_list.typecode, 'q')
+            self.assertEqual(result['d'], distance(200))
+            self.assertEqual(result['total_revenue'], restaurantFinder(result['d'], site_list)[0])
+            self.assertGreater(result['traced_peak_bytes'], 0)
+
+    def test_2(self):
+        old = benchmark.run_case('reference', 'random', 100, repeat=1, memory=False)
+        new = dict(old, seconds=old['seconds'] * 2)
+        self.assertEqual([row['regression'] for row in benchmark.compare([new], [old])], [True])
+        self.assertEqual([row['regression'] for row in benchmark.compare([old], [new])], [False])
+        self.assertEqual(benchmark.compare([dict(old, N=5)], [old]), [])
+
+    def test_3(self):
+        old = benchmark.run_case_isolated('reference', 'random', 100, repeat=1)
+        self.assertTrue(old['isolated'])
+        bigger = dict(old, traced_peak_bytes=old['traced_peak_bytes'] * 2)
+        self.assertEqual([(row['memory_regression'], row['peak_rss_ratio'])
+                          for row in benchmark.compare([bigger], [old])], [(True, 1.0)])
+        in_process = dict(old, isolated=False, peak_rss_bytes=old['peak_rss_bytes'] * 2)
+        self.assertEqual([(row['memory_regression'], row['peak_rss_ratio'])
+                          for row in benchmark.compare([in_process], [old])], [(False, None)])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            arguments = ['--sizes', '100', '--repeat', '1', '--patterns', 'random']
+            self.assertEqual(benchmark.main(arguments + ['--output', path]), 0)
+            self.assertEqual(benchmark.main(arguments + ['--output', path + '2', '--baseline', path,
+                                                         '--tolerance', '1000']), 0)
+            self.assertEqual(benchmark.main(arguments + ['--in-process', '--output', path + '3', '--baseline', path,
+                                                         '--tolerance', '1000']), 0)
+
+class TestCSRFloorGraph(unittest.TestCase):
+
+    def test_1(self):
+        graph = CSRFloorGraph([(0, 1, 4), (0, 3, 2), (0, 2, 3), (2, 3, 2), (3, 0, 3)], [(0, 5), (3, 2), (1, 3)])
+        self.assertEqual(list(graph.offsets), [0, 3, 3, 4, 5])
+        self.assertEqual(list(graph.targets), [1, 3, 2, 3, 0])
+        self.assertEqual(list(graph.weights), [4, 2, 3, 2, 3])
+        self.assertEqual(list(graph.reverse_offsets), [0, 1, 2, 3, 5])
+        self.assertEqual(list(graph.reverse_targets), [3, 0, 0, 0, 2])
+        self.assertEqual(graph.climb(0, [1, 2]), (7, [0, 1]))
+        self.assertEqual(graph.climb(0, [1, 2]), (7, [0, 1]))
+        self.assertEqual(graph.climb(1, [2]), None)
+
+    def test_2(self):
+        paths = [(0, 1, 4), (1, 2, 2), (2, 3, 3), (3, 4, 1), (1, 5, 2), (5, 6, 5), (6, 3, 2), (6, 4, 3), (1, 7, 4),
+                 (7, 8, 2), (8, 7, 2), (7, 3, 2), (8, 0, 11), (4, 3, 1), (4, 8, 10)]
+        keys = [(5, 10), (6, 1), (7, 5), (0, 3), (8, 4)]
+        graph = CSRFloorGraph(paths, keys)
+        for start in range(9):
+            for exits in ([7, 2, 4], [8], [3, 4], [0, 4], [4]):
+                self.assertEqual(graph.climb(start, exits), FloorGraph(paths, keys).climb(start, exits))
+
+    def test_3(self):
+        generator = random.Random(3)
+        for _ in range(300):
+            locations = generator.randint(2, 7)
+            paths = [(generator.randrange(locations), generator.randrange(locations), generator.randint(0, 5))
+                     for _ in range(generator.randint(1, 15))] + [(locations - 1, 0, generator.randint(0, 5))]
+            keys = [(generator.randrange(locations), generator.randint(0, 5)) for _ in range(generator.randint(1, 3))]
+            start = generator.randrange(locations)
+            exits = generator.sample(range(locations), generator.randint(1, 2))
+
+            time = [[0 if u == v else float('inf') for v in range(locations)] for u in range(locations)]
+            for u, v, x in paths:
+                time[u][v] = min(time[u][v], x)
+            for w, u, v in itertools.product(range(locations), repeat=3):
+                time[u][v] = min(time[u][v], time[u][w] + time[w][v])
+            best = min(time[start][k] + y + min(time[k][e] for e in exits) for k, y in keys)
+
+            outcome = CSRFloorGraph(paths, keys).climb(start, exits)
+            if best == float('inf'):
+                self.assertIsNone(outcome)
+                continue
+            total_time, route = outcome
+            self.assertEqual(total_time, best)
+            self.assertEqual((route[0], route[-1] in exits), (start, True))
+            travel = sum(min(x for u, v, x in paths if (u, v) == step) for step in zip(route, route[1:]))
+            self.assertIn(total_time - travel, [y for k, y in keys if k in route])
+
+class TestSearchContext(unittest.TestCase):
+
+    def test_1(self):
+        graph = FloorGraph([(0, 1, 4), (0, 3, 2), (0, 2, 3), (2, 3, 2), (3, 0, 3)], [(0, 5), (3, 2), (1, 3)])
+        context = SearchContext(len(graph.locations))
+        graph.dijkstra(0, context)
+        self.assertEqual([context.time_to_reach(i) for i in range(4)], [0, 4, 3, 2])
+        self.assertEqual([context.previous_location(i) for i in range(4)], [None, 0, 0, 0])
+        graph.dijkstra(1, context)
+        self.assertEqual([context.time_to_reach(i) for i in range(4)], [float('inf'), 0, float('inf'), float('inf')])
+        self.assertEqual(context.route(1), [1])
+        graph.search([1, 2], reverse=True, context=context)
+        self.assertEqual([context.time_to_reach(i) for i in range(4)], [3, 0, 0, 6])
+        self.assertEqual(context.route(3), [2, 0, 3])
+        self.assertEqual(graph.get_shortest_path(2, 1), [2, 3, 0, 1])
+        self.assertIsNone(graph.get_shortest_path(1, 0))
+
+    def test_2(self):
+        for Graph in (FloorGraph, CSRFloorGraph):
+            graph = Graph([(0, 1, 4), (0, 3, 2), (0, 2, 3), (2, 3, 2), (3, 0, 3)], [(0, 5), (3, 2), (1, 3)])
+            for _ in range(3):
+                self.assertEqual(graph.climb(0, [1, 2]), (7, [0, 1]))
+                self.assertEqual(graph.climb(1, [2]), None)
+                self.assertEqual(graph.climb(2, [1]), (11, [2, 3, 0, 1]))
+            self.assertEqual(len(graph.layered_search_contexts.free), 1)
+            self.assertEqual(graph.layered_search_contexts.free[0].epoch, 9)
+            self.assertEqual(graph.search_contexts.free, [])
+
+class TestLayeredClimb(unittest.TestCase):
+
+    def test_1(self):
+        paths = [(0, 1, 4), (1, 2, 2), (2, 3, 3), (3, 4, 1), (1, 5, 2), (5, 6, 5), (6, 3, 2), (6, 4, 3), (1, 7, 4),
+                 (7, 8, 2), (8, 7, 2), (7, 3, 2), (8, 0, 11), (4, 3, 1), (4, 8, 10)]
+        keys = [(5, 10), (6, 1), (7, 5), (0, 3), (8, 4)]
+        graph = FloorGraph(paths, keys)
+        for start in range(9):
+            for exits in ([7, 2, 4], [8], [3, 4], [0, 4], [4], [2]):
+                key, total_time, _ = graph.find_location_to_grab_key(start, exits)
+                outcome = graph.climb(start, exits)
+                self.assertEqual(outcome and outcome[0], None if total_time == float('inf') else total_time)
+
+    def test_2(self):
+        graph = FloorGraph([(0, 1, 1), (1, 0, 1), (1, 2, 1)], [(1, 9), (0, 5), (1, 2)])
+        self.assertEqual(graph.key_at[1].y, 2)
+        self.assertEqual(graph.climb(0, [2]), (4, [0, 1, 2]))
+        self.assertEqual(graph.climb(1, [1]), (2, [1]))
+        self.assertEqual(graph.climb(0, [0]), (4, [0, 1, 0]))
+        self.assertEqual(graph.climb(2, [0]), None)
+        context = graph.search_layered(0, [2])
+        self.assertEqual(context.route(context.stopped_at), [0, 1, 4, 5])
+        self.assertEqual(FloorGraph.layered_route(context, 3), [0, 1, 2])
+
+class TestClimbTable(unittest.TestCase):
+
+    def test_1(self):
+        paths = [(0, 1, 4), (1, 2, 2), (2, 3, 3), (3, 4, 1), (1, 5, 2), (5, 6, 5), (6, 3, 2), (6, 4, 3), (1, 7, 4),
+                 (7, 8, 2), (8, 7, 2), (7, 3, 2), (8, 0, 11), (4, 3, 1), (4, 8, 10)]
+        keys = [(5, 10), (6, 1), (7, 5), (0, 3), (8, 4)]
+        for Graph in (FloorGraph, CSRFloorGraph):
+            graph = Graph(paths, keys)
+            for exits in ([7, 2, 4], [8], [3, 4], [0, 4], [4], [2]):
+                table = graph.climb_table(exits)
+                for start in range(9):
+                    outcome = table.climb(start)
+                    expected = graph.climb(start, exits)
+                    self.assertEqual(outcome and outcome[0], expected and expected[0])
+                    if outcome is None:
+                        self.assertIsNone(table.key(start))
+                        continue
+                    route = outcome[1]
+                    self.assertEqual((route[0], route[-1] in exits, table.key(start) in route), (start, True, True))
+                    travel = sum(min(x for u, v, x in paths if (u, v) == step) for step in zip(route, route[1:]))
+                    self.assertEqual(travel + min(y for k, y in keys if k == table.key(start)), outcome[0])
+
+    def test_2(self):
+        graph = FloorGraph([(0, 1, 4), (0, 3, 2), (0, 2, 3), (2, 3, 2), (3, 0, 3)], [(0, 5), (3, 2), (1, 3)])
+        table = graph.climb_table([1, 2])
+        self.assertEqual([table.time(start) for start in range(4)], [7, 3, 10, 8])
+        self.assertEqual([table.key(start) for start in range(4)], [1, 1, 3, 3])
+        self.assertEqual(table.climb(0), (7, [0, 1]))
+        self.assertEqual(table.climb(2), (10, [2, 3, 0, 2]))
+        self.assertEqual(graph.climb_table([0]).climb(1), None)
+
 class TestClimbKing(unittest.TestCase):
 
     def test_1(self):
@@ -681,7 +1315,23 @@ class TestClimbKing(unittest.TestCase):
 
         outcome = graph.climb(start, exits)
         self.assertEqual(outcome, None)
-        
+
+    def test_31(self):
+        paths = [(0, 1, 4), (1, 2, 2), (2, 3, 3), (3, 4, 1), (1, 5, 2), (5, 6, 5), (6, 3, 2), (6, 4, 3), (1, 7, 4), (7, 8, 2), (8, 7, 2), (7, 3, 2), (8, 0, 11), (4, 3, 1), (4, 8, 10)]
+        keys = [(5, 10), (6, 1), (7, 5), (0, 3), (8, 4)]
+        graph = FloorGraph(paths, keys)
+        adjacency = [[(path.v.ID, path.x) for path in location.paths] for location in graph.locations]
+        queries = [(1, [7, 2, 4]), (7, [8]), (1, [3, 4]), (1, [0, 4]), (3, [4])] * 4
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outcomes = list(executor.map(lambda query: graph.climb(*query), queries))
+
+        self.assertEqual(outcomes[:5], [(9, [1, 7]), (6, [7, 8]), (10, [1, 5, 6, 3]), (11, [1, 5, 6, 4]),
+                                        (20, [3, 4, 8, 7, 3, 4])])
+        self.assertEqual(outcomes, outcomes[:5] * 4)
+        self.assertEqual([[(path.v.ID, path.x) for path in location.paths] for location in graph.locations], adjacency)
+        self.assertEqual(len(graph.locations), 9)
+
 if __name__ == '__main__':
 
  unittest.main()
\ No newline at end of file
@@ -0,0 +1,15 @@
+__version__ = '1.0.0'
+
+from assignment1.restaurant import (
+    RestaurantCache, RestaurantPlanner, RestaurantSolver, RestaurantSweep, RestaurantWhatIf, convert_sites_to_binary,
+    restaurantFinder, restaurantFinder_batch, restaurantFinder_budget, restaurantFinder_file, restaurantFinder_many,
+    restaurantFinder_max_sites, restaurantFinder_parallel, restaurantFinder_plans, restaurantFinder_positions,
+    restaurantFinder_radii, restaurantFinder_sparse, restaurantFinder_stream, restaurantFinder_sweep, restaurant_totals,
+    write_site_file,
+)
+from assignment1.floor_graph import (
+    ClimbTable, CSRFloorGraph, FloorGraph, Key, Location, Path, SearchContext, SearchContextPool,
+)
+from assignment1.backends import (
+    BACKENDS, BACKEND_ENVIRONMENT_VARIABLE, Backend, backend_report, get_backend, register_backend,
+)
@@ -0,0 +1,197 @@
+import os
+import platform
+from typing import Callable, Dict, List, Optional, Tuple
+
+from assignment1 import restaurant
+from assignment1.floor_graph import CSRFloorGraph, FloorGraph
+
+BACKEND_ENVIRONMENT_VARIABLE = 'ASSIGNMENT1_BACKEND'
+DEFAULT_BACKEND = 'reference'
+
+
+class Backend:
+    def __init__(self, name: str, description: str, restaurantFinder: Callable, FloorGraph: type,
+                 capabilities: Tuple[str, ...] = (), requires: Tuple[str, ...] = ()):
+        """
+        Function description:
+        Initialize a Backend object, one implementation of restaurantFinder and FloorGraph that can be chosen at
+        runtime.
+
+        :Input:
+        name: str, the name the backend is chosen by
+        description: str, a short description of the implementation
+        restaurantFinder: the function to use as restaurantFinder(d, site_list)
+        FloorGraph: the class to use as FloorGraph(paths, keys)
+        capabilities: what the implementation is good at, for the report
+        requires: the names of the optional modules the backend needs
+
+        :Output, return or postcondition:
+        Make an object of instance Backend
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        self.name = name
+        self.description = description
+        self.restaurantFinder = restaurantFinder
+        self.FloorGraph = FloorGraph
+        self.capabilities = capabilities
+        self.requires = requires
+
+    def missing(self) -> List[str]:
+        """
+        Function description:
+        Get the optional modules the backend needs that cannot be imported.
+
+        :Time complexity:
+        O(R), where R is the number of required modules.
+
+        :Aux space complexity:
+        O(R)
+        """
+        missing = []
+        for module in self.requires:
+            try:
+                __import__(module)
+            except ImportError:
+                missing.append(module)
+        return missing
+
+    def version(self) -> str:
+        """
+        Function description:
+        Get the version of the backend: the package version followed by the versions of its required modules.
+
+        :Time complexity:
+        O(R), where R is the number of required modules.
+
+        :Aux space complexity:
+        O(R)
+        """
+        from assignment1 import __version__
+        versions = [__version__]
+        for module in self.requires:
+            try:
+                versions.append(f"{module} {getattr(__import__(module), '__version__', 'unknown')}")
+            except ImportError:
+                pass
+        return ', '.join(versions)
+
+
+BACKENDS: Dict[str, Backend] = {}
+
+
+def register_backend(backend: Backend):
+    """
+    Function description:
+    Add a backend to the registry, replacing any backend with the same name.
+
+    :Input:
+    backend: Backend, the backend to add
+
+    :Output, return or postcondition:
+    The backend can be chosen by its name
+
+    :Time complexity:
+    O(1)
+
+    :Aux space complexity:
+    O(1)
+    """
+    BACKENDS[backend.name] = backend
+
+
+def get_backend(name: Optional[str] = None) -> Backend:
+    """
+    Function description:
+    Choose a backend by name, by the ASSIGNMENT1_BACKEND environment variable, or else the reference backend.
+
+    :Input:
+    name: Optional, the name of the backend
+
+    :Output, return or postcondition:
+    The chosen Backend. KeyError is raised for an unknown name, and ImportError if a module it needs is missing.
+
+    :Time complexity:
+    O(R), where R is the number of modules the backend needs.
+
+    :Aux space complexity:
+    O(R)
+    """
+    name = name or os.environ.get(BACKEND_ENVIRONMENT_VARIABLE) or DEFAULT_BACKEND
+    if name not in BACKENDS:
+        raise KeyError(f"unknown backend {name!r}, choose from {sorted(BACKENDS)}")
+    backend = BACKENDS[name]
+    missing = backend.missing()
+    if missing:
+        raise ImportError(f"backend {name!r} requires {', '.join(missing)}")
+    return backend
+
+
+def backend_report() -> dict:
+    """
+    Function description:
+    Report the backends that are registered, whether they can be used here, and their versions.
+
+    :Output, return or postcondition:
+    A dictionary with the package version, the Python version, the default backend and, for every backend, its
+    description, capabilities, version, whether it is available and the modules it is missing
+
+    :Time complexity:
+    O(B * R), where B is the number of backends and R is the most modules a backend needs.
+
+    :Aux space complexity:
+    O(B * R)
+    """
+    from assignment1 import __version__
+    return {
+        'version': __version__,
+        'python': platform.python_version(),
+        'default': os.environ.get(BACKEND_ENVIRONMENT_VARIABLE) or DEFAULT_BACKEND,
+        'backends': {
+            name: {'description': backend.description, 'capabilities': list(backend.capabilities),
+                   'version': backend.version(),
+                   'available': not backend.missing(), 'missing': backend.missing()}
+            for name, backend in BACKENDS.items()
+        },
+    }
+
+
+def restaurantFinder_numpy(d: int, site_list: List[int]) -> Tuple[int, List[int]]:
+    """
+    Function description:
+    restaurantFinder run through restaurantFinder_batch as a single scenario.
+
+    Approach description:
+    restaurantFinder_batch vectorises across scenarios, not across sites, so with one scenario it is still a loop over
+    the sites, on arrays of one element. It is much slower than the reference for a single corridor, and is only here
+    to check the batch engine against the other backends.
+
+    :Time complexity:
+    O(N), where N is the number of sites.
+
+    :Aux space complexity:
+    O(min(d, N) + N/8 + K), where K is the number of chosen sites.
+    """
+    totals, sites = restaurant.restaurantFinder_batch(d, [site_list])
+    return (totals.tolist()[0], sites[0])
+
+
+register_backend(Backend('reference', "list-based dynamic programming and object-based graph, the oracle",
+                         restaurant.restaurantFinder, FloorGraph, capabilities=('restaurantFinder', 'FloorGraph')))
+register_backend(Backend('array', "ring buffer of d+1 totals with bit-packed decisions",
+                         restaurant.restaurantFinder_stream, FloorGraph,
+                         capabilities=('restaurantFinder', 'streaming', 'low memory')))
+register_backend(Backend('numpy', "scenario-batch engine (restaurantFinder_batch) run on one scenario, vectorised "
+                         "across scenarios only, so much slower than the reference for a single corridor",
+                         restaurantFinder_numpy, FloorGraph, capabilities=('restaurantFinder', 'scenario batches'),
+                         requires=('numpy',)))
+register_backend(Backend('parallel', "chunked (max, +) scan over a process pool when d+3 is below the number of "
+                         "workers, otherwise the reference dynamic programming",
+                         restaurant.restaurantFinder_parallel, FloorGraph,
+                         capabilities=('restaurantFinder', 'multiprocess')))
+register_backend(Backend('csr', "list-based dynamic programming and a graph in compressed sparse row arrays",
+                         restaurant.restaurantFinder, CSRFloorGraph, capabilities=('FloorGraph', 'low memory')))
@@ -0,0 +1,286 @@
+from array import array
+import argparse
+import concurrent.futures
+import json
+import multiprocessing
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # resource is only available on Unix
+    resource = None
+
+from assignment1.backends import get_backend
+
+
+def random_sites(N: int, rng: random.Random) -> array:
+    """
+    Function description:
+    Revenues drawn uniformly from -1000 to 1000.
+
+    :Time complexity:
+    O(N)
+
+    :Aux space complexity:
+    O(N), 8 bytes per site in an array('q')
+    """
+    return array('q', (rng.randint(-1000, 1000) for _ in range(N)))
+
+
+def all_positive_sites(N: int, rng: random.Random) -> array:
+    """
+    Function description:
+    Revenues drawn uniformly from 1 to 1000, so every site is worth opening on its own.
+
+    :Time complexity:
+    O(N)
+
+    :Aux space complexity:
+    O(N), 8 bytes per site in an array('q')
+    """
+    return array('q', (rng.randint(1, 1000) for _ in range(N)))
+
+
+def alternating_sites(N: int, rng: random.Random) -> array:
+    """
+    Function description:
+    Revenues that alternate between positive and negative, which makes the include/exclude decision flip at every
+    site.
+
+    :Time complexity:
+    O(N)
+
+    :Aux space complexity:
+    O(N), 8 bytes per site in an array('q')
+    """
+    return array('q', (rng.randint(1, 1000) if i % 2 == 0 else -rng.randint(1, 1000) for i in range(N)))
+
+
+def mostly_negative_sites(N: int, rng: random.Random) -> array:
+    """
+    Function description:
+    Revenues where about 95% of the sites are negative and the rest are positive.
+
+    :Time complexity:
+    O(N)
+
+    :Aux space complexity:
+    O(N), 8 bytes per site in an array('q')
+    """
+    return array('q', (rng.randint(1, 1000) if rng.random() < 0.05 else -rng.randint(1, 1000) for _ in range(N)))
+
+
+# Each pattern is a revenue generator and the d it is run with, as a function of N
+PATTERNS: Dict[str, Tuple[Callable[[int, random.Random], array], Callable[[int], int]]] = {
+    'random': (random_sites, lambda N: 3),
+    'all_positive': (all_positive_sites, lambda N: 3),
+    'alternating': (alternating_sites, lambda N: 1),
+    'mostly_negative': (mostly_negative_sites, lambda N: 3),
+    'huge_d': (random_sites, lambda N: max(1, N // 2)),
+}
+
+
+def peak_rss() -> Optional[int]:
+    """
+    Function description:
+    Get the peak resident set size of this process so far, in bytes, or None where it is not available. It is a
+    high-water mark over the whole life of the process, so it only describes one case when the case runs in a fresh
+    process (see run_case_isolated).
+
+    :Time complexity:
+    O(1)
+
+    :Aux space complexity:
+    O(1)
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024  # Linux reports kilobytes, macOS bytes
+
+
+def run_case(backend: str, pattern: str, N: int, seed: int = 0, repeat: int = 3, memory: bool = True) -> dict:
+    """
+    Function description:
+    Benchmark restaurantFinder of a backend on one generated site list.
+
+    Approach description:
+    The site list is generated from the seed, so every run sees the same revenues. The fastest of repeat timed runs
+    is kept. With memory, one more run is traced with tracemalloc to get the peak memory allocated by the run itself,
+    kept apart from the timed runs because tracing slows Python down.
+
+    :Input:
+    backend: str, the name of the backend
+    pattern: str, the name of the revenue pattern in PATTERNS
+    N: int, the number of sites
+    seed: int, the random seed of the generator
+    repeat: int, the number of timed runs
+    memory: bool, whether to trace the peak memory
+
+    :Output, return or postcondition:
+    A dictionary with the case (backend, pattern, N, d, seed), the best wall time in seconds, the sites per second,
+    the traced peak memory in bytes (or None), the peak RSS of the whole process so far in bytes (or None), whether
+    the case ran in a process of its own (isolated, False here) and the total revenue
+
+    :Time complexity:
+    O((repeat + 1) * the time of restaurantFinder)
+
+    :Aux space complexity:
+    O(N)
+    """
+    generate, distance = PATTERNS[pattern]
+    site_list = generate(N, random.Random(seed))
+    d = distance(N)
+    restaurantFinder = get_backend(backend).restaurantFinder
+
+    best_time = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        total_revenue, _ = restaurantFinder(d, site_list)
+        best_time = min(best_time, time.perf_counter() - start)
+
+    traced_peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            restaurantFinder(d, site_list)
+            traced_peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {'backend': backend, 'pattern': pattern, 'N': N, 'd': d, 'seed': seed, 'seconds': best_time,
+            'sites_per_second': N / best_time if best_time > 0 else None, 'traced_peak_bytes': traced_peak,
+            'peak_rss_bytes': peak_rss(), 'isolated': False, 'total_revenue': total_revenue}
+
+
+def run_case_isolated(backend: str, pattern: str, N: int, seed: int = 0, repeat: int = 3, memory: bool = True) -> dict:
+    """
+    Function description:
+    run_case in a freshly spawned process, so that its peak RSS belongs to this case alone.
+
+    Approach description:
+    A one-worker process pool with the spawn start method is made for every case. The new interpreter only imports
+    the package and generates the sites from the seed, so its peak RSS covers the interpreter, the sites and the run
+    of this case, and not any earlier case.
+
+    :Output, return or postcondition:
+    The dictionary of run_case, with isolated set to True
+
+    :Time complexity:
+    O((repeat + 1) * the time of restaurantFinder), plus starting an interpreter
+
+    :Aux space complexity:
+    O(1) in this process, O(N) in the new one
+    """
+    context = multiprocessing.get_context('spawn')
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        result = executor.submit(run_case, backend, pattern, N, seed, repeat, memory).result()
+    result['isolated'] = True
+    return result
+
+
+def compare(results: List[dict], baseline: List[dict], tolerance: float = 0.2) -> List[dict]:
+    """
+    Function description:
+    Compare benchmark results with a stored baseline.
+
+    Approach description:
+    Time and memory are compared the same way: the new value over the baseline value. The traced peak is compared
+    when both runs traced memory, and the peak RSS only when both cases ran in a process of their own, since
+    otherwise it includes earlier cases.
+
+    :Input:
+    results: the new results, as returned by run_case
+    baseline: the stored results
+    tolerance: float, how much slower or bigger than the baseline (as a fraction) still counts as no regression
+
+    :Output, return or postcondition:
+    A list with one dictionary per result that has a matching case in the baseline: the case, the baseline and new
+    times and their ratio, the ratios of the traced peaks and of the peak RSS (None when they can't be compared),
+    whether the time or the memory is a regression, and whether the total revenue changed
+
+    :Time complexity:
+    O(R + B), where R and B are the numbers of results and baseline results.
+
+    :Aux space complexity:
+    O(B)
+    """
+    def case(result: dict) -> tuple:
+        return (result['backend'], result['pattern'], result['N'], result['d'], result['seed'])
+
+    def ratio(new: Optional[float], old: Optional[float]) -> Optional[float]:
+        if new is None or old is None:
+            return None
+        return new / old if old > 0 else float('inf')
+
+    stored = {case(result): result for result in baseline}
+    comparisons = []
+    for result in results:
+        if case(result) not in stored:
+            continue
+        old = stored[case(result)]
+        time_ratio = ratio(result['seconds'], old['seconds'])
+        traced_ratio = ratio(result.get('traced_peak_bytes'), old.get('traced_peak_bytes'))
+        isolated = result.get('isolated') and old.get('isolated')
+        rss_ratio = ratio(result.get('peak_rss_bytes'), old.get('peak_rss_bytes')) if isolated else None
+        comparisons.append({'backend': result['backend'], 'pattern': result['pattern'], 'N': result['N'],
+                            'baseline_seconds': old['seconds'], 'seconds': result['seconds'], 'ratio': time_ratio,
+                            'traced_peak_ratio': traced_ratio, 'peak_rss_ratio': rss_ratio,
+                            'regression': time_ratio > 1 + tolerance,
+                            'memory_regression': any(memory_ratio is not None and memory_ratio > 1 + tolerance
+                                                     for memory_ratio in (traced_ratio, rss_ratio)),
+                            'revenue_changed': old['total_revenue'] != result['total_revenue']})
+    return comparisons
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Function description:
+    Command line entry point: python -m assignment1.benchmark --sizes 1000000 --output results.json
+
+    :Output, return or postcondition:
+    The results (and the comparison, with --baseline) are written as JSON. Every case runs in a process of its own
+    unless --in-process is given. Returns 1 if a case got slower or bigger than the baseline by more than the
+    tolerance or its total revenue changed, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark restaurantFinder on large generated site lists.")
+    parser.add_argument('--sizes', type=lambda size: int(float(size)), nargs='+', default=[10 ** 6])
+    parser.add_argument('--patterns', nargs='+', choices=sorted(PATTERNS), default=sorted(PATTERNS))
+    parser.add_argument('--backends', nargs='+', default=['reference'])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc run")
+    parser.add_argument('--in-process', action='store_true',
+                        help="run every case in this process, so peak_rss_bytes is only a process-wide peak")
+    parser.add_argument('--output', help="file to write the JSON results to, stdout by default")
+    parser.add_argument('--baseline', help="JSON results of an earlier run to compare with")
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    arguments = parser.parse_args(argv)
+
+    run = run_case if arguments.in_process else run_case_isolated
+    results = [run(backend, pattern, N, arguments.seed, arguments.repeat, not arguments.no_memory)
+               for backend in arguments.backends for pattern in arguments.patterns for N in arguments.sizes]
+    report = {'results': results}
+    failed = False
+    if arguments.baseline:
+        with open(arguments.baseline) as file:
+            baseline = json.load(file)
+        report['comparison'] = compare(results, baseline.get('results', baseline), arguments.tolerance)
+        failed = any(row['regression'] or row['memory_regression'] or row['revenue_changed']
+                     for row in report['comparison'])
+
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
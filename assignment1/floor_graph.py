@@ -0,0 +1,1013 @@
+from array import array
+import heapq
+from typing import List, Optional, Tuple
+
+
+class Location:
+    def __init__(self, ID: int):
+        """
+        Function description:
+        Initialize a Location object.
+
+        :Input:
+        ID: int, ID of the location
+
+        :Output, return or postcondition:
+        Make an object of instance location
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        self.ID = ID
+        self.paths = []
+        self.reverse_paths = []
+
+class Path:
+    def __init__(self, v: 'Location', x:int):
+        """
+        Function description:
+        Initialize a Path object.
+
+        :Input:
+        v: Location, the destination Location
+        x: int, the weight of the path
+
+        :Output, return or postcondition:
+        Make an object of instance Path
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        self.v = v
+        self.x = x
+
+class Key:
+    def __init__(self, k: int, y:int):
+        """
+        Function description:
+        Initialize a Key object.
+
+        :Input:
+        k: int, the location ID of key
+        y: int, amount of time needed to defeat the monster and retrieve the key
+
+        :Output, return or postcondition:
+        Make an object of instance Key
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        self.k = k
+        self.y = y
+
+class SearchContext:
+    def __init__(self, location_count: int):
+        """
+        Function description:
+        Initialize a SearchContext object, the state of one Dijkstra's search over a graph.
+
+        Approach description:
+        The time to reach and previous location of every location are kept in flat arrays instead of on the Location
+        objects. Every search gets a new epoch, and an entry only counts if it was stamped with the current epoch, so
+        starting a new search never has to reset the arrays.
+
+        :Input:
+        location_count: int, the number of locations in the graph
+
+        :Output, return or postcondition:
+        Make an object of instance SearchContext
+
+        :Time complexity:
+        O(|V|), where |V| is the number of locations
+
+        :Aux space complexity:
+        O(|V|)
+        """
+        self.epoch = 0
+        self.reached = array('q', bytes(8 * location_count))  # epoch in which times and previous were last set
+        self.visited = array('q', bytes(8 * location_count))  # epoch in which the location was last visited
+        self.times = [0] * location_count
+        self.previous = array('q', bytes(8 * location_count))
+        self.stopped_at = None
+
+    def begin(self):
+        """
+        Function description:
+        Start a new search, forgetting everything about the last one.
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        self.epoch += 1
+        self.stopped_at = None
+
+    def time_to_reach(self, ID: int) -> float:
+        """
+        Function description:
+        Get the time the search found to reach a location.
+
+        :Output, return or postcondition:
+        The time to reach the location, or inf if the search did not reach it
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        return self.times[ID] if self.reached[ID] == self.epoch else float('inf')
+
+    def previous_location(self, ID: int) -> Optional[int]:
+        """
+        Function description:
+        Get the previous location on the shortest path the search found to a location.
+
+        :Output, return or postcondition:
+        The index of the previous location, or None for a source or a location the search did not reach
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        if self.reached[ID] != self.epoch or self.previous[ID] == -1:
+            return None
+        return self.previous[ID]
+
+    def route(self, end_index: int) -> List[int]:
+        """
+        Function description:
+        Follow the previous locations back from end_index to the source the search came from.
+
+        :Input:
+        end_index: int, index of a location the search reached
+
+        :Output, return or postcondition:
+        List[int], the location indices from the source to end_index
+
+        :Time complexity:
+        O(|V|), a route visits each location at most once
+
+        :Aux space complexity:
+        O(|V|)
+        """
+        route = []
+        while end_index is not None:
+            route.append(end_index)
+            end_index = self.previous_location(end_index)
+        route.reverse()
+        return route
+
+
+class SearchContextPool:
+    def __init__(self, location_count: int):
+        """
+        Function description:
+        Initialize a SearchContextPool object, the free SearchContext objects of one graph.
+
+        Approach description:
+        Searches borrow a context and give it back when they are done, so a graph only ever makes as many contexts
+        as it has searches running at once. list.pop and list.extend are atomic, so threads can share the pool.
+
+        :Input:
+        location_count: int, the number of locations in the graph
+
+        :Output, return or postcondition:
+        Make an object of instance SearchContextPool
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        self.location_count = location_count
+        self.free = []
+
+    def acquire(self) -> SearchContext:
+        """
+        Function description:
+        Borrow a context, making a new one if none are free.
+
+        :Time complexity:
+        O(1), or O(|V|) when a new context has to be made
+
+        :Aux space complexity:
+        O(1), or O(|V|) when a new context has to be made
+        """
+        try:
+            return self.free.pop()
+        except IndexError:
+            return SearchContext(self.location_count)
+
+    def release(self, *contexts: SearchContext):
+        """
+        Function description:
+        Give borrowed contexts back to the pool.
+
+        :Time complexity:
+        O(C), where C is the number of contexts
+
+        :Aux space complexity:
+        O(1)
+        """
+        self.free.extend(contexts)
+
+class ClimbTable:
+    def __init__(self, to_exit: SearchContext, to_key: SearchContext, location_count: int):
+        """
+        Function description:
+        Initialize a ClimbTable object, the best climb from every start location to a fixed set of exits.
+
+        Approach description:
+        to_exit is a reverse search from the exits, so its previous location of a location is the next one on the way
+        to the nearest exit. to_key is a reverse search seeded at every key location with the time to defeat the
+        monster plus the time from there to the nearest exit, so its time is the best climb time from each start and
+        its previous location is the next one on the way to the key. The key each start uses is the source its
+        to_key chain ends at, found for all starts at once by walking each chain only until a location whose key is
+        already known.
+
+        :Input:
+        to_exit: SearchContext, the finished reverse search from the exits
+        to_key: SearchContext, the finished reverse search seeded at the keys
+        location_count: int, the number of locations
+
+        :Output, return or postcondition:
+        Make an object of instance ClimbTable
+
+        :Time complexity:
+        O(|V|), every location is given its key once
+
+        :Aux space complexity:
+        O(|V|)
+        """
+        self.to_exit = to_exit
+        self.to_key = to_key
+        self.location_count = location_count
+        self.key_locations = array('q', [-1]) * location_count
+        for start in range(location_count):
+            if self.key_locations[start] != -1 or to_key.time_to_reach(start) == float('inf'):
+                continue
+            chain = [start]
+            while to_key.previous_location(chain[-1]) is not None and self.key_locations[chain[-1]] == -1:
+                chain.append(to_key.previous_location(chain[-1]))
+            key_location = chain[-1] if self.key_locations[chain[-1]] == -1 else self.key_locations[chain[-1]]
+            for location in chain:
+                self.key_locations[location] = key_location
+
+    def time(self, start: int) -> float:
+        """
+        Function description:
+        Get the best climb time from start.
+
+        :Output, return or postcondition:
+        The total time of the best climb, or inf if no exit can be reached with a key
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        return self.to_key.time_to_reach(start)
+
+    def key(self, start: int) -> Optional[int]:
+        """
+        Function description:
+        Get the location of the key the best climb from start grabs.
+
+        :Output, return or postcondition:
+        The index of the key location, or None if no exit can be reached with a key
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        return None if self.key_locations[start] == -1 else self.key_locations[start]
+
+    def route(self, start: int) -> Optional[List[int]]:
+        """
+        Function description:
+        Get the route of the best climb from start.
+
+        Approach description:
+        Follow the to_key chain from start to its key, then the to_exit chain from the key to its exit.
+
+        :Output, return or postcondition:
+        Optional[List[int]], the location indices from start to the exit, or None if no route is found
+
+        :Time complexity:
+        O(|V|), the length of the route
+
+        :Aux space complexity:
+        O(|V|)
+        """
+        if self.key(start) is None:
+            return None
+        route = [start]
+        while self.to_key.previous_location(route[-1]) is not None:
+            route.append(self.to_key.previous_location(route[-1]))
+        while self.to_exit.previous_location(route[-1]) is not None:
+            route.append(self.to_exit.previous_location(route[-1]))
+        return route
+
+    def climb(self, start: int) -> Optional[tuple]:
+        """
+        Function description:
+        The result climb(start, exits) gives for the exits of the table.
+
+        :Output, return or postcondition:
+        Tuple or none: a tuple containing the total time and the list of Location indices representing the route,
+        or None if no route is found
+
+        :Time complexity:
+        O(|V|), the length of the route
+
+        :Aux space complexity:
+        O(|V|)
+        """
+        route = self.route(start)
+        return None if route is None else (self.time(start), route)
+
+
+class FloorGraph:
+    def __init__(self, paths: List[Tuple[int,int,int]], keys: List[Tuple[int,int]]):
+        """
+        Function description:
+        Initialize a FloorGraph object and construct the graph.
+
+        Approach description:
+        I initialize the attributes then call construct_graph.
+
+        :Input:
+        paths: List[Tuple[int,int,int]], list of paths represented as [u, v, x]. u is the source, v is the destination,
+        and x is the travel time
+        keys: List[List[int,int]], list of keys represented as [k, y]
+
+        :Output, return or postcondition:
+        Initialize the FloorGraph object
+
+        :Time complexity:
+        O(|V| + |E|), where |V| is the number of locations and |E| is the total number of paths
+        because we are initializing each location and path
+        :Aux space complexity:
+        O(|V| + |E|) because we are initializing each location and path
+        """
+        self.locations = []
+        self.keys = []
+        self.key_at = {}
+        self.construct_graph(paths, keys)
+        self.search_contexts = SearchContextPool(len(self.locations))
+        self.layered_search_contexts = SearchContextPool(2 * len(self.locations))
+
+    def construct_graph(self, paths: List[Tuple[int,int,int]], keys: List[Tuple[int,int]]):
+        """
+        Function description:
+        Construct the graph with the given paths and keys.
+
+        Approach description:
+        I identify the highest index of a location entered. Add 1 to the highest index to ensure that it loops
+        through all of them. Then I added the locations to self.locations, added keys to self.keys, and added the path
+        to each location. I also add every path reversed to the reverse_paths of its destination, so searches towards
+        the exits never need to flip the graph.
+
+        :Input:
+        paths: List[Tuple[int,int,int]], list of paths represented as [u, v, x]
+        keys: List[Tuple[int,int]], list of keys represented as [k, y]
+
+        :Output, return or postcondition:
+        construct the graph, its reverse adjacency, and initialize Key objects, with key_at holding the fastest key
+        at each location that has one
+
+        :Time complexity:
+        O(|V| + |E|), where |V| is the number of locations and |E| is the total number of paths
+        because we are initializing each location and path
+
+        :Aux space complexity:
+        O(|V| + |E|), because we are initializing each location and path
+        """
+        for i in range(max(max(paths, key=lambda x: max(x[:2]))[:2]) + 1):
+            self.locations.append(Location(i))
+
+        for key in keys:
+            self.keys.append(Key(key[0], key[1]))
+            if key[0] not in self.key_at or key[1] < self.key_at[key[0]].y:  # only the fastest key of a location counts
+                self.key_at[key[0]] = self.keys[-1]
+
+        for path in paths:
+            u, v, x = path
+            self.locations[u].paths.append(Path(self.locations[v], x))
+
+        for location in self.locations:  # ordered by source, like the paths of a flipped graph
+            for path in location.paths:
+                path.v.reverse_paths.append(Path(location, path.x))
+
+    def dijkstra(self, start_index: int, context: Optional[SearchContext] = None) -> SearchContext:
+        """
+        Function description:
+        Perform Dijkstra's algorithm from start_index to find the time_to_reach for each location.
+
+        :Input:
+        start_index: int, the starting location index for Dijkstra's algorithm
+        context: Optional[SearchContext], the context to search in, a new one if None
+
+        :Output, return or postcondition:
+        The SearchContext holding the time_to_reach of each location
+
+        :Time complexity:
+        O(|E| log(|V|)). |V| is the number of locations and |E| is the total number of paths. Because each location is
+        inserted into the priority queue once which costs O(log |V|) time. For each path, we perform a decrease-key
+        operation on the heap which also costs O(log |V|) time. So, the total time complexity is O(|E| log(|V|)).
+
+        :Aux space complexity:
+        O(|V|+|E|) because we need to store the locations in the priority queue. In the worst case, all locations will
+        be in the queue at once.
+        """
+        return self.search([start_index], context=context)
+
+    def get_shortest_path(self, start_index: int, end_index: int) -> Optional[List[int]]:
+        """
+        Function description:
+        Find the shortest path between two locations.
+
+        :Input:
+        start_index: int, index of the starting location
+        end_index: int, index of the ending location
+
+        :Output, return or postcondition:
+        Optional[List[int]], a list of Location indices representing the shortest path, or None if no path exists
+
+        :Time complexity:
+        O(|E| log(|V|)), runs Dijkstra’s algorithm, which has a time complexity of O(|E| log(|V|)).
+
+        :Aux space complexity:
+        O(|V|+|E|), needs to run Dijkstra's.
+        """
+        context = self.search_contexts.acquire()
+        try:
+            self.search([start_index], stop={end_index}, context=context)
+            return None if context.stopped_at is None else context.route(end_index)
+        finally:
+            self.search_contexts.release(context)
+
+    def search(self, sources: List[int], reverse: bool = False, stop: Optional[set] = None,
+               context: Optional[SearchContext] = None, source_times: Optional[List[int]] = None) -> SearchContext:
+        """
+        Function description:
+        Perform Dijkstra's algorithm from one or more sources without changing the graph.
+
+        Approach description:
+        The times and previous locations are kept in a SearchContext instead of on the Location objects, so any
+        number of searches can run on the same graph, and starting a search in a used context costs O(1). The heap
+        holds (time, ID) pairs, so a time is never changed while it is in the heap. Every source starts at time 0,
+        which is the same as searching from a new location with paths of time 0 to each of them, or with source_times,
+        paths of those times. With reverse, the reverse_paths are followed instead. With stop, the search ends as soon
+        as a location in stop is visited.
+
+        :Input:
+        sources: List[int], the indices of the locations the search starts from
+        reverse: bool, whether to follow the paths backwards
+        stop: Optional[set], indices of locations to stop the search at
+        context: Optional[SearchContext], the context to search in, a new one if None
+        source_times: Optional[List[int]], the time each source starts at, 0 if None
+
+        :Output, return or postcondition:
+        The SearchContext holding the time to reach and previous location of each location, with stopped_at set to
+        the location in stop the search ended at, or None
+
+        :Time complexity:
+        O(|E| log(|V|)), as dijkstra
+
+        :Aux space complexity:
+        O(|V| + |E|) for the heap, plus O(|V|) for a new context
+        """
+        if context is None:
+            context = SearchContext(len(self.locations))
+        context.begin()
+        epoch, reached, visited = context.epoch, context.reached, context.visited
+        times, previous = context.times, context.previous
+        queue = []
+        for i, source in enumerate(sources):
+            time = 0 if source_times is None else source_times[i]
+            if reached[source] != epoch or time < times[source]:
+                reached[source] = epoch
+                times[source] = time
+                previous[source] = -1
+                queue.append((time, source))
+        heapq.heapify(queue)
+
+        while queue:
+            current_time, current_index = heapq.heappop(queue)
+            if visited[current_index] == epoch:
+                continue
+            visited[current_index] = epoch
+            if stop is not None and current_index in stop:
+                context.stopped_at = current_index
+                return context
+
+            current_location = self.locations[current_index]
+            for path in (current_location.reverse_paths if reverse else current_location.paths):
+                tentative_time = current_time + path.x
+                v = path.v.ID
+                if reached[v] != epoch or tentative_time < times[v]:
+                    reached[v] = epoch
+                    times[v] = tentative_time
+                    previous[v] = current_index
+                    heapq.heappush(queue, (tentative_time, v))
+        return context
+
+    def find_location_to_grab_key(self, start: int, exits: List[int], from_start: Optional[SearchContext] = None,
+                                  to_exit: Optional[SearchContext] = None) -> Tuple[Optional['Key'], float, SearchContext]:
+        """
+        Function description:
+        Find the Location to grab a key to minimize time.
+
+        Approach description:
+        First I search from start, which gives the minimum time to reach each key. Then I search backwards along the
+        reverse paths from all the exits at once, which gives the minimum time from each key to its nearest exit, as
+        if there was a new location connected to all exits with paths of time 0. I then find the first key that has
+        the minimum combination of time to reach from start, time to reach an exit, and the time to fight the monster
+        of that key. Neither the graph nor the keys are changed.
+
+        :Input:
+        start: int, index of the starting location
+        exits: List[int], list of indices of exit Locations
+        from_start, to_exit: Optional[SearchContext], the contexts to run the two searches in, new ones if None
+
+        :Output, return or postcondition:
+        (key, total_time, from_start): the Key object representing the optimal location to grab a key (None if there
+        are no keys), its total time, and the context of the search from start
+
+        :Time complexity:
+        O(|E|log(|V|)), where |E| is the number of edges, |V| is the number of vertices. Searches twice, with time
+        complexity of O(|E| log(|V|)). Then finds the minimum key, which takes O(|V|) time.
+
+        :Aux space complexity:
+        O(|V| + |E|), because it runs Dijkstra's
+        """
+        from_start = self.search([start], context=from_start)
+        to_exit = self.search(exits, reverse=True, context=to_exit)
+
+        best_key, best_time = None, float('inf')
+        for key in self.keys:
+            total_time = from_start.time_to_reach(key.k) + key.y + to_exit.time_to_reach(key.k)
+            if best_key is None or total_time < best_time:
+                best_key, best_time = key, total_time
+        return best_key, best_time, from_start
+
+    def search_layered(self, start: int, exits: List[int], context: Optional[SearchContext] = None) -> SearchContext:
+        """
+        Function description:
+        Perform Dijkstra's algorithm on the graph of (location, has key) states, from start without a key to the
+        nearest exit with a key.
+
+        Approach description:
+        State ID is location ID before the key is grabbed and |V| + location ID after. Both layers have the paths of
+        the graph, and a location with a key has one more path from its state without the key to its state with the
+        key, with the time to defeat the monster as its travel time. The layered graph is never built: the paths of a
+        state are the paths of its location, moved to the layer of the state. The search stops at the first exit
+        visited with the key, which is the end of the best climb.
+
+        :Input:
+        start: int, index of the starting location
+        exits: List[int], list of indices of exit Locations
+        context: Optional[SearchContext], a context for 2|V| states to search in, a new one if None
+
+        :Output, return or postcondition:
+        The SearchContext of the search, with stopped_at set to the state of the exit reached with the key, or None if
+        no exit can be reached with a key
+
+        :Time complexity:
+        O(|E| log(|V|)), Dijkstra's on a graph of 2|V| states and at most 2|E| + |V| paths
+
+        :Aux space complexity:
+        O(|V| + |E|) for the heap, plus O(|V|) for a new context
+        """
+        location_count = len(self.locations)
+        if context is None:
+            context = SearchContext(2 * location_count)
+        context.begin()
+        epoch, reached, visited = context.epoch, context.reached, context.visited
+        times, previous = context.times, context.previous
+        stop = {location_count + exit_location for exit_location in exits}
+        reached[start] = epoch
+        times[start] = 0
+        previous[start] = -1
+        queue = [(0, start)]
+
+        while queue:
+            current_time, current_state = heapq.heappop(queue)
+            if visited[current_state] == epoch:
+                continue
+            visited[current_state] = epoch
+            if current_state in stop:
+                context.stopped_at = current_state
+                return context
+
+            if current_state < location_count:
+                layer = 0
+                key = self.key_at.get(current_state)
+                if key is not None:  # grab the key
+                    tentative_time = current_time + key.y
+                    v = location_count + current_state
+                    if reached[v] != epoch or tentative_time < times[v]:
+                        reached[v] = epoch
+                        times[v] = tentative_time
+                        previous[v] = current_state
+                        heapq.heappush(queue, (tentative_time, v))
+            else:
+                layer = location_count
+            for path in self.locations[current_state - layer].paths:
+                tentative_time = current_time + path.x
+                v = layer + path.v.ID
+                if reached[v] != epoch or tentative_time < times[v]:
+                    reached[v] = epoch
+                    times[v] = tentative_time
+                    previous[v] = current_state
+                    heapq.heappush(queue, (tentative_time, v))
+        return context
+
+    @staticmethod
+    def layered_route(context: SearchContext, location_count: int) -> List[int]:
+        """
+        Function description:
+        Turn the states on the route of a finished search_layered into the route of locations.
+
+        Approach description:
+        Every state maps back to its location. The path that grabs the key goes from a location to the same location,
+        so that location is kept once.
+
+        :Input:
+        context: SearchContext, the context of a search_layered that reached an exit
+        location_count: int, the number of locations
+
+        :Output, return or postcondition:
+        List[int], the location indices from start to the exit
+
+        :Time complexity:
+        O(|V|)
+
+        :Aux space complexity:
+        O(|V|)
+        """
+        states = context.route(context.stopped_at)
+        route = []
+        for state in states:
+            if state >= location_count > route[-1]:
+                route.pop()  # the key is grabbed here, keep the location once
+            route.append(state)
+        return [state % location_count for state in route]
+
+    def climb(self, start: int, exits: List[int]) -> Optional[tuple]:
+        """
+        Function description:
+        The main climb function.
+
+        Approach description:
+        One search of the layered graph of (location, has key) states (see search_layered) from start without the key
+        to the nearest exit with the key. Its time is the total time, and following its previous states back once gives
+        the whole route. The search runs in a context borrowed from the graph's pool, so nothing has to be reset and
+        climb can run on the same graph from several threads at once.
+
+        :Input:
+        start: int, index of the starting location
+        exits: List[int], list of indices of exit Locations
+
+        :Output, return or postcondition:
+        Tuple or none: a tuple containing the total time and the list of Location indices representing the route,
+        or None if no route is found
+
+        :Time complexity:
+        O(|E|log(|V|)), one run of Dijkstra's on the layered graph.
+
+        :Aux space complexity:
+        O(|V|+|E|), from running Dijkstra's.
+        """
+        context = self.layered_search_contexts.acquire()
+        try:
+            self.search_layered(start, exits, context)
+            if context.stopped_at is None:
+                return None
+            return context.time_to_reach(context.stopped_at), self.layered_route(context, len(self.locations))
+        finally:
+            self.layered_search_contexts.release(context)
+
+    def climb_table(self, exits: List[int]) -> ClimbTable:
+        """
+        Function description:
+        Find the best climb from every start location to the given exits at once.
+
+        Approach description:
+        One reverse search from all the exits gives the time from every location to its nearest exit. Then one more
+        reverse search is seeded at every key location with the time to defeat its fastest monster plus the time from
+        there to the nearest exit. The time it finds for a location is the best climb time from it, since a climb is
+        a path to some key followed by the best path from that key to an exit. See ClimbTable.
+
+        :Input:
+        exits: List[int], list of indices of exit Locations
+
+        :Output, return or postcondition:
+        ClimbTable: the best time, key and route of the climb from every start location
+
+        :Time complexity:
+        O(|E|log(|V|)), two runs of Dijkstra's for all |V| starts, instead of one climb per start.
+
+        :Aux space complexity:
+        O(|V|+|E|)
+        """
+        to_exit = self.search(exits, reverse=True)
+        seeds = [k for k in self.key_at if to_exit.time_to_reach(k) != float('inf')]
+        to_key = self.search(seeds, reverse=True,
+                             source_times=[self.key_at[k].y + to_exit.time_to_reach(k) for k in seeds])
+        return ClimbTable(to_exit, to_key, len(self.locations))
+
+
+class CSRFloorGraph:
+    def __init__(self, paths: List[Tuple[int,int,int]], keys: List[Tuple[int,int]]):
+        """
+        Function description:
+        Initialize a CSRFloorGraph object, a FloorGraph stored in compressed sparse row form.
+
+        Approach description:
+        Instead of a Location object per location and a Path object per path, the paths leaving location u are the
+        entries offsets[u] to offsets[u+1] of the flat targets and weights arrays. The reversed paths are stored the
+        same way, so climb never has to flip the graph. The paths are kept in the same order as the paths and
+        reverse_paths of FloorGraph, so ties are broken the same way.
+
+        :Input:
+        paths: List[Tuple[int,int,int]], list of paths represented as [u, v, x]
+        keys: List[Tuple[int,int]], list of keys represented as [k, y]
+
+        :Output, return or postcondition:
+        Initialize the CSRFloorGraph object
+
+        :Time complexity:
+        O(|V| + |E|), where |V| is the number of locations and |E| is the total number of paths
+
+        :Aux space complexity:
+        O(|V| + |E|), four flat arrays of |E| integers and two of |V|+1 integers
+        """
+        self.location_count = max(max(path[:2]) for path in paths) + 1
+        sources = array('q', (path[0] for path in paths))
+        destinations = array('q', (path[1] for path in paths))
+        weights = array('q', (path[2] for path in paths))
+        self.offsets, self.targets, self.weights = self.build_csr(self.location_count, sources, destinations, weights)
+        self.reverse_offsets, self.reverse_targets, self.reverse_weights = \
+            self.build_csr(self.location_count, destinations, sources, weights, by_target=True)
+        self.key_at = {}
+        for key in keys:  # only the fastest key of a location counts
+            if key[0] not in self.key_at or key[1] < self.key_at[key[0]]:
+                self.key_at[key[0]] = key[1]
+        self.search_contexts = SearchContextPool(self.location_count)
+        self.layered_search_contexts = SearchContextPool(2 * self.location_count)
+
+    @staticmethod
+    def build_csr(location_count: int, sources: array, destinations: array, weights: array, by_target: bool = False) \
+            -> Tuple[array, array, array]:
+        """
+        Function description:
+        Build the compressed sparse row arrays of a list of paths.
+
+        Approach description:
+        A stable counting sort of the paths by source, so the paths of every source end up together in their given
+        order. With by_target, it is a two pass radix sort instead: by destination first, then by source, so the paths
+        of every source are ordered by destination.
+
+        :Input:
+        location_count: int, the number of locations
+        sources, destinations, weights: array, the paths as three parallel arrays
+        by_target: bool, whether to order the paths of every source by destination
+
+        :Output, return or postcondition:
+        (offsets, targets, weights), where the paths leaving location u are targets[offsets[u]:offsets[u+1]] with
+        weights[offsets[u]:offsets[u+1]]
+
+        :Time complexity:
+        O(|V| + |E|)
+
+        :Aux space complexity:
+        O(|V| + |E|)
+        """
+        order = range(len(sources))
+        for column in ((destinations, sources) if by_target else (sources,)):
+            counts = array('q', bytes(8 * (location_count + 1)))
+            for location in column:
+                counts[location + 1] += 1
+            for location in range(location_count):
+                counts[location + 1] += counts[location]
+            sorted_order = array('q', bytes(8 * len(sources)))
+            for path in order:
+                sorted_order[counts[column[path]]] = path
+                counts[column[path]] += 1
+            order = sorted_order
+
+        offsets = array('q', bytes(8 * (location_count + 1)))
+        for location in sources:
+            offsets[location + 1] += 1
+        for location in range(location_count):
+            offsets[location + 1] += offsets[location]
+        return (offsets, array('q', (destinations[path] for path in order)),
+                array('q', (weights[path] for path in order)))
+
+    def dijkstra(self, sources: List[int], reverse: bool = False, stop: Optional[set] = None,
+                 context: Optional[SearchContext] = None, source_times: Optional[List[int]] = None) -> SearchContext:
+        """
+        Function description:
+        Perform Dijkstra's algorithm on the flat arrays from one or more sources.
+
+        Approach description:
+        The same search as FloorGraph.search, reading the paths of a location from the flat arrays.
+
+        :Input:
+        sources: List[int], the locations the search starts from
+        reverse: bool, whether to follow the paths backwards
+        stop: Optional[set], locations to stop the search at
+        context: Optional[SearchContext], the context to search in, a new one if None
+        source_times: Optional[List[int]], the time each source starts at, 0 if None
+
+        :Output, return or postcondition:
+        The SearchContext holding the time to reach and previous location of each location, with stopped_at set to
+        the location in stop the search ended at, or None
+
+        :Time complexity:
+        O(|E| log(|V|))
+
+        :Aux space complexity:
+        O(|V| + |E|) for the heap, plus O(|V|) for a new context
+        """
+        if reverse:
+            offsets, targets, weights = self.reverse_offsets, self.reverse_targets, self.reverse_weights
+        else:
+            offsets, targets, weights = self.offsets, self.targets, self.weights
+        if context is None:
+            context = SearchContext(self.location_count)
+        context.begin()
+        epoch, reached, visited = context.epoch, context.reached, context.visited
+        times, previous = context.times, context.previous
+        queue = []
+        for i, source in enumerate(sources):
+            time = 0 if source_times is None else source_times[i]
+            if reached[source] != epoch or time < times[source]:
+                reached[source] = epoch
+                times[source] = time
+                previous[source] = -1
+                queue.append((time, source))
+        heapq.heapify(queue)
+
+        while queue:
+            current_time, current_location = heapq.heappop(queue)
+            if visited[current_location] == epoch:
+                continue
+            visited[current_location] = epoch
+            if stop is not None and current_location in stop:
+                context.stopped_at = current_location
+                return context
+
+            for path in range(offsets[current_location], offsets[current_location + 1]):
+                tentative_time = current_time + weights[path]
+                v = targets[path]
+                if reached[v] != epoch or tentative_time < times[v]:
+                    reached[v] = epoch
+                    times[v] = tentative_time
+                    previous[v] = current_location
+                    heapq.heappush(queue, (tentative_time, v))
+        return context
+
+    def dijkstra_layered(self, start: int, exits: List[int], context: Optional[SearchContext] = None) \
+            -> SearchContext:
+        """
+        Function description:
+        Perform Dijkstra's algorithm on the flat arrays over (location, has key) states.
+
+        Approach description:
+        The same search as FloorGraph.search_layered, reading the paths of a location from the flat arrays and the
+        time to grab a key from key_at.
+
+        :Input:
+        start: int, index of the starting location
+        exits: List[int], list of indices of exit Locations
+        context: Optional[SearchContext], a context for 2|V| states to search in, a new one if None
+
+        :Output, return or postcondition:
+        The SearchContext of the search, with stopped_at set to the state of the exit reached with the key, or None if
+        no exit can be reached with a key
+
+        :Time complexity:
+        O(|E| log(|V|))
+
+        :Aux space complexity:
+        O(|V| + |E|) for the heap, plus O(|V|) for a new context
+        """
+        location_count, offsets, targets, weights = self.location_count, self.offsets, self.targets, self.weights
+        if context is None:
+            context = SearchContext(2 * location_count)
+        context.begin()
+        epoch, reached, visited = context.epoch, context.reached, context.visited
+        times, previous = context.times, context.previous
+        stop = {location_count + exit_location for exit_location in exits}
+        reached[start] = epoch
+        times[start] = 0
+        previous[start] = -1
+        queue = [(0, start)]
+
+        while queue:
+            current_time, current_state = heapq.heappop(queue)
+            if visited[current_state] == epoch:
+                continue
+            visited[current_state] = epoch
+            if current_state in stop:
+                context.stopped_at = current_state
+                return context
+
+            if current_state < location_count:
+                layer = 0
+                if current_state in self.key_at:  # grab the key
+                    tentative_time = current_time + self.key_at[current_state]
+                    v = location_count + current_state
+                    if reached[v] != epoch or tentative_time < times[v]:
+                        reached[v] = epoch
+                        times[v] = tentative_time
+                        previous[v] = current_state
+                        heapq.heappush(queue, (tentative_time, v))
+            else:
+                layer = location_count
+            current_location = current_state - layer
+            for path in range(offsets[current_location], offsets[current_location + 1]):
+                tentative_time = current_time + weights[path]
+                v = layer + targets[path]
+                if reached[v] != epoch or tentative_time < times[v]:
+                    reached[v] = epoch
+                    times[v] = tentative_time
+                    previous[v] = current_state
+                    heapq.heappush(queue, (tentative_time, v))
+        return context
+
+    def climb(self, start: int, exits: List[int]) -> Optional[tuple]:
+        """
+        Function description:
+        The climb of FloorGraph, run on the flat arrays.
+
+        Approach description:
+        One search over (location, has key) states (see dijkstra_layered) from start without the key to the nearest
+        exit with the key, then one walk back over its previous states for the route, as in FloorGraph.climb.
+
+        :Input:
+        start: int, index of the starting location
+        exits: List[int], list of indices of exit Locations
+
+        :Output, return or postcondition:
+        Tuple or none: a tuple containing the total time and the list of Location indices representing the route,
+        or None if no route is found
+
+        :Time complexity:
+        O(|E|log(|V|)), one run of Dijkstra's
+
+        :Aux space complexity:
+        O(|V| + |E|), from running Dijkstra's
+        """
+        context = self.layered_search_contexts.acquire()
+        try:
+            self.dijkstra_layered(start, exits, context)
+            if context.stopped_at is None:
+                return None
+            return context.time_to_reach(context.stopped_at), FloorGraph.layered_route(context, self.location_count)
+        finally:
+            self.layered_search_contexts.release(context)
+
+    def climb_table(self, exits: List[int]) -> ClimbTable:
+        """
+        Function description:
+        The climb_table of FloorGraph, run on the flat arrays.
+
+        :Input:
+        exits: List[int], list of indices of exit Locations
+
+        :Output, return or postcondition:
+        ClimbTable: the best time, key and route of the climb from every start location
+
+        :Time complexity:
+        O(|E|log(|V|)), two runs of Dijkstra's
+
+        :Aux space complexity:
+        O(|V|+|E|)
+        """
+        to_exit = self.dijkstra(exits, reverse=True)
+        seeds = [k for k in self.key_at if to_exit.time_to_reach(k) != float('inf')]
+        to_key = self.dijkstra(seeds, reverse=True,
+                               source_times=[self.key_at[k] + to_exit.time_to_reach(k) for k in seeds])
+        return ClimbTable(to_exit, to_key, self.location_count)
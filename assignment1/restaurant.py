@@ -0,0 +1,2158 @@
+from array import array
+from typing import Iterable, List, Tuple, Optional
+import collections
+import concurrent.futures
+import csv
+import hashlib
+import heapq
+import itertools
+import json
+import mmap
+import numbers
+import os
+import sqlite3
+import struct
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed by the vectorised functions
+    np = None
+
+
+def restaurantFinder(d: int, site_list: List[int], max_sites: Optional[int] = None) -> Tuple[int, List[int]]:
+    """
+    Function description:
+    This function assists a fast food chain in selecting optimal sites for opening restaurants. The selection is done
+    such that no two restaurants are within 'd' km of each other and the total revenue is maximized. Optionally, at
+    most max_sites restaurants can be opened.
+
+    Approach description:
+    The function uses a dynamic programming approach. It maintains the list 'total_revenue', which stores the maximum
+    revenue that can be obtained up to each site, and the array 'taken', which records one include/exclude decision
+    per site. For each site, the function considers two options: including the current site or excluding it. It
+    compares the total revenue obtained from these two options and chooses the one with maximum revenue, only
+    including the site when it is strictly better. After finding the maximum total revenue for all sites, the function
+    reconstructs the list of selected sites with one backward pass over the decisions (see reconstruct_sites). If
+    these use more than max_sites sites, the answer comes from restaurantFinder_max_sites instead.
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    site_list: A list of revenues for each site.
+    max_sites: Optional, the largest number of sites that can be chosen (the revenues must then be integers).
+
+    :Output, return or postcondition:
+    The function returns a tuple with two elements: The maximum total revenue that can be obtained and a list of the
+    chosen sites that are 1-indexed, (0, []) if there are no sites. TypeError is raised if max_sites is given and a
+    revenue is not an integer.
+
+    :Time complexity:
+    O(N), where N is the number of potential sites. This is because the function makes a single pass over the list of
+    potential sites to fill the table and a single backward pass to reconstruct the chosen sites. For each site, it
+    performs a constant amount of work. When max_sites is hit, it is O(N log R) instead, where R is the largest revenue.
+
+    :Aux space complexity:
+    O(N). The function maintains the list 'total_revenue' and the array 'taken', each of which has a length of N. The
+    decisions take one byte per site instead of a copied list of chosen sites per site.
+    """
+    if max_sites is not None:
+        check_integer_revenues(site_list)
+    N = len(site_list)
+    total_revenue = [0]*N
+    taken = array('b', bytes(N))
+
+    for i in range(N):
+        # Consider the current site and the maximum revenue from sites that are at least d km away
+        include_site = site_list[i] + (total_revenue[i-d-1] if i-d-1 >= 0 else 0)
+        exclude_site = total_revenue[i-1] if i > 0 else 0
+
+        if include_site > exclude_site:
+            total_revenue[i] = include_site
+            taken[i] = 1
+        else:
+            total_revenue[i] = exclude_site
+
+    chosen_sites = reconstruct_sites(d, taken)
+    if max_sites is not None and len(chosen_sites) > max_sites:
+        return restaurantFinder_max_sites(d, site_list, max_sites)
+    return (total_revenue[-1] if N > 0 else 0, chosen_sites)
+
+
+def reconstruct_sites(d: int, taken) -> List[int]:
+    """
+    Function description:
+    Rebuild the list of chosen sites from the include/exclude decision recorded for each site.
+
+    Approach description:
+    Starting from the last site, a site that was included means the previous chosen site is at least d+1 sites
+    before it, so we jump back d+1 sites. A site that was excluded means we move back by one site. The sites are
+    collected in reverse order and then reversed.
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    taken: An indexable sequence of decisions (truthy if the site was included) with one entry per site.
+
+    :Output, return or postcondition:
+    A list of the chosen sites that are 1-indexed, in increasing order.
+
+    :Time complexity:
+    O(N), where N is the number of sites, because each step moves back by at least one site.
+
+    :Aux space complexity:
+    O(N) for the list of chosen sites.
+    """
+    sites = []
+    i = len(taken) - 1
+    while i >= 0:
+        if taken[i]:
+            sites.append(i+1)  # Convert to 1-indexed sites
+            i -= d+1
+        else:
+            i -= 1
+    sites.reverse()
+    return sites
+
+
+class DecisionBits:
+    def __init__(self):
+        """
+        Function description:
+        Initialize an empty, append-only array of include/exclude decisions packed eight to a byte.
+
+        :Output, return or postcondition:
+        Make an object of instance DecisionBits
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        self.bits = bytearray()
+        self.length = 0
+
+    def append(self, taken: bool):
+        """
+        Function description:
+        Record the decision for the next site.
+
+        :Input:
+        taken: bool, True if the site was included
+
+        :Output, return or postcondition:
+        The decision is stored at index len(self) - 1
+
+        :Time complexity:
+        Amortised O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        if self.length % 8 == 0:
+            self.bits.append(0)
+        if taken:
+            self.bits[self.length >> 3] |= 1 << (self.length & 7)
+        self.length += 1
+
+    def __getitem__(self, i: int) -> bool:
+        """
+        Function description:
+        Get the decision recorded for site i (0-indexed).
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        return bool(self.bits[i >> 3] >> (i & 7) & 1)
+
+    def __len__(self) -> int:
+        return self.length
+
+
+class RestaurantPlanner:
+    def __init__(self, d: int):
+        """
+        Function description:
+        Initialize a RestaurantPlanner object, which solves restaurantFinder for sites that are added one at a time at
+        the end of the corridor.
+
+        Approach description:
+        The recurrence only needs the total revenue of the previous site and of the site d+1 positions back, so the
+        totals are kept in a ring buffer of d+1 entries, and each new site is one step of the recurrence. The
+        include/exclude decision of every site is packed into a DecisionBits array, and the chosen sites are rebuilt
+        from it with reconstruct_sites only when they are asked for. The tie-breaking is the same as restaurantFinder,
+        so the result is identical.
+
+        :Input:
+        d: The minimum distance between any two chosen sites.
+
+        :Output, return or postcondition:
+        Make an object of instance RestaurantPlanner with no sites
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        self.d = d
+        self.window = []
+        self.taken = DecisionBits()
+        self.previous = 0
+
+    def append(self, revenue: int):
+        """
+        Function description:
+        Add a site at the end of the corridor.
+
+        :Input:
+        revenue: int, the revenue of the new site
+
+        :Output, return or postcondition:
+        The best total revenue includes the new site
+
+        :Time complexity:
+        Amortised O(1)
+
+        :Aux space complexity:
+        O(1), and one bit per site in total
+        """
+        self.extend((revenue,))
+
+    def extend(self, revenues: Iterable[int]):
+        """
+        Function description:
+        Add sites at the end of the corridor, in order.
+
+        :Input:
+        revenues: An iterable of revenues of the new sites.
+
+        :Output, return or postcondition:
+        The best total revenue includes the new sites
+
+        :Time complexity:
+        O(M), where M is the number of new sites.
+
+        :Aux space complexity:
+        O(min(d, M)), and one bit per site in total
+        """
+        d = self.d
+        window = self.window
+        taken = self.taken
+        previous = self.previous
+
+        for i, revenue in enumerate(revenues, len(taken)):
+            slot = i % (d+1)
+            # The slot being overwritten holds the total from d+1 sites back
+            include_site = revenue + (window[slot] if i > d else 0)
+
+            if include_site > previous:
+                previous = include_site
+                taken.append(True)
+            else:
+                taken.append(False)
+
+            if i > d:
+                window[slot] = previous
+            else:
+                window.append(previous)
+
+        self.previous = previous
+
+    def best(self) -> int:
+        """
+        Function description:
+        Get the maximum total revenue of the sites added so far.
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        return self.previous
+
+    def sites(self) -> List[int]:
+        """
+        Function description:
+        Reconstruct the chosen sites of the sites added so far.
+
+        :Output, return or postcondition:
+        The list of chosen sites that are 1-indexed, the same as restaurantFinder gives.
+
+        :Time complexity:
+        O(N), where N is the number of sites added so far.
+
+        :Aux space complexity:
+        O(K), where K is the number of chosen sites.
+        """
+        return reconstruct_sites(self.d, self.taken)
+
+    def __len__(self) -> int:
+        return len(self.taken)
+
+
+def restaurantFinder_stream(d: int, revenues: Iterable[int]) -> Tuple[int, List[int]]:
+    """
+    Function description:
+    Same as restaurantFinder, but the revenues can come from any iterable (for example a generator reading a file)
+    and are consumed in a single pass without being stored.
+
+    Approach description:
+    The revenues are added to a RestaurantPlanner, which only keeps a ring buffer of d+1 totals and one bit per site
+    for the include/exclude decisions. The tie-breaking is the same as restaurantFinder, so the result is identical.
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    revenues: An iterable of revenues for each site.
+
+    :Output, return or postcondition:
+    A tuple with the maximum total revenue and a list of the chosen sites that are 1-indexed. An empty iterable gives
+    (0, []).
+
+    :Time complexity:
+    O(N), where N is the number of sites.
+
+    :Aux space complexity:
+    O(min(d, N) + N/8 + K), where K is the number of chosen sites. The ring buffer holds at most d+1 totals and
+    each decision takes one bit.
+    """
+    planner = RestaurantPlanner(d)
+    planner.extend(revenues)
+    return (planner.best(), planner.sites())
+
+
+def numpy_revenues(revenue_matrix) -> 'np.ndarray':
+    """
+    Function description:
+    Convert revenues to a NumPy array that the vectorised functions can add up without overflowing.
+
+    Approach description:
+    Integer revenues become int64 when every total is sure to fit, that is when N * max |revenue| < 2^63 for rows of
+    N sites, and Python int objects otherwise, which never overflow but are slower. No revenues at all become int64
+    too, so that their totals are the integer 0. Other revenues are kept as they are.
+
+    :Input:
+    revenue_matrix: An array-like of revenues, the sites along the last axis.
+
+    :Output, return or postcondition:
+    A NumPy array of the revenues
+
+    :Time complexity:
+    O(S * N), where S * N is the number of revenues.
+
+    :Aux space complexity:
+    O(S * N)
+    """
+    revenues = np.asarray(revenue_matrix)
+    if revenues.size == 0:  # an empty list would be float64
+        return revenues.astype(np.int64)
+    if revenues.dtype.kind not in 'biu':
+        return revenues
+    if revenues.shape[-1] * max(abs(int(revenues.max())), abs(int(revenues.min()))) >= 1 << 63:
+        return revenues.astype(object)
+    return revenues.astype(np.int64)
+
+
+def restaurantFinder_batch(d: int, revenue_matrix) -> Tuple['np.ndarray', List[List[int]]]:
+    """
+    Function description:
+    Run restaurantFinder on many revenue scenarios for the same corridor and the same d at once.
+
+    Approach description:
+    Row s of the S x N matrix is the site_list of scenario s. The recurrence of restaurantFinder is advanced for all S
+    scenarios together with NumPy vector operations, one site (column) per step. Like restaurantFinder_stream, only a
+    ring buffer of the last d+1 totals is kept, and the include/exclude decisions of each step are packed into bits.
+    The chosen sites are then rebuilt for all scenarios together by walking back from the last site, moving each
+    scenario back by d+1 sites if its site was included and by one site otherwise. The tie-breaking is the same as
+    restaurantFinder, so every row gives the same result as calling restaurantFinder on it. Revenues whose totals
+    could pass 2^63 are kept as Python ints (see numpy_revenues).
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    revenue_matrix: An S x N array-like of revenues, one row per scenario.
+
+    :Output, return or postcondition:
+    A tuple with two elements: a NumPy array of the S maximum total revenues and a list with the S lists of chosen
+    sites that are 1-indexed.
+
+    :Time complexity:
+    O(S * N), done in O(N) vectorised steps, where S is the number of scenarios and N is the number of sites.
+
+    :Aux space complexity:
+    O(S * (min(d, N) + N/8) + K), where K is the total number of chosen sites.
+    """
+    if np is None:
+        raise ImportError("restaurantFinder_batch requires NumPy")
+    revenues = numpy_revenues(revenue_matrix)
+    if revenues.ndim != 2:
+        raise ValueError("revenue_matrix must be two dimensional")
+    S, N = revenues.shape
+    if S == 0:
+        return (np.zeros(0, dtype=revenues.dtype), [])
+
+    window = np.zeros((min(d+1, N), S), dtype=revenues.dtype)
+    taken = np.zeros((N, (S+7) // 8), dtype=np.uint8)
+    previous = np.zeros(S, dtype=revenues.dtype)
+
+    for i in range(N):
+        slot = i % (d+1)
+        include_site = revenues[:, i] + window[slot] if i > d else revenues[:, i]
+        take = include_site > previous
+        previous = np.where(take, include_site, previous)
+        taken[i] = np.packbits(take)
+        window[slot] = previous
+
+    # Walk back from the last site for every scenario that has not reached the first site yet
+    position = np.full(S, N-1, dtype=np.int64)
+    chosen_scenarios = []
+    chosen_positions = []
+    active = np.flatnonzero(position >= 0)
+    while active.size:
+        current = position[active]
+        take = (taken[current, active >> 3] >> (7 - (active & 7)) & 1).astype(bool)
+        chosen_scenarios.append(active[take])
+        chosen_positions.append(current[take])
+        position[active] = current - np.where(take, d+1, 1)
+        active = active[position[active] >= 0]
+
+    if chosen_scenarios:
+        scenarios = np.concatenate(chosen_scenarios)
+        positions = np.concatenate(chosen_positions)
+    else:
+        scenarios = positions = np.zeros(0, dtype=np.int64)
+    order = np.lexsort((positions, scenarios))
+    boundaries = np.cumsum(np.bincount(scenarios, minlength=S))[:-1]
+    sites = [(group + 1).tolist() for group in np.split(positions[order], boundaries)]  # Convert to 1-indexed sites
+
+    return (previous, sites)
+
+
+class RestaurantSweep:
+    def __init__(self, dmax: int, site_list: List[int]):
+        """
+        Function description:
+        Initialize a RestaurantSweep object and compute the maximum total revenue for every d from 0 to dmax.
+
+        Approach description:
+        For d >= N-1 at most one site can be chosen, so all of those d share the answer for d = N-1 and only
+        d = 0..min(dmax, N-1) are solved. When NumPy is available, the recurrence of restaurantFinder is advanced for all
+        of those d together, one site per step. A ring buffer of the last min(dmax, N-1)+2 totals is kept for every d,
+        and each d reads the total from its own d+1 sites back out of it. Without NumPy, each d is solved with
+        restaurantFinder_stream. Revenues whose totals could pass 2^63 are kept as Python ints (see numpy_revenues). The
+        chosen sites are only computed when asked for (see sites).
+
+        :Input:
+        dmax: int, the largest minimum distance to solve for
+        site_list: A list of revenues for each site.
+
+        :Output, return or postcondition:
+        self.revenues[d] is the maximum total revenue for minimum distance d, for 0 <= d <= dmax
+
+        :Time complexity:
+        O(N * D), where N is the number of sites and D = min(dmax, N-1) + 1, done in O(N) vectorised steps with NumPy.
+
+        :Aux space complexity:
+        O(D^2 + dmax) for the ring buffer and the answers.
+        """
+        self.site_list = site_list
+        self.chosen_sites = {}
+        N = len(site_list)
+        solved = min(dmax, N-1) + 1
+
+        if np is not None and 2 * (solved + 1) * solved <= 1 << 24:
+            revenues = numpy_revenues(site_list)
+            width = solved + 1
+            # Every row is stored twice, at j % width and j % width + width, so the totals d+1 sites back for all
+            # d lie on one diagonal of the buffer. Rows not written yet are all 0.
+            window = np.zeros((2 * width, solved), dtype=revenues.dtype)
+            flat = window.reshape(-1)
+            diagonal = -np.arange(solved) * (solved - 1)
+            for i in range(N):
+                row = (i - 1) % width + width
+                include_site = np.take(flat, diagonal + row * solved) + revenues[i]
+                current = np.maximum(include_site, window[row])
+                window[i % width] = current
+                window[i % width + width] = current
+            totals = window[(N - 1) % width].tolist()
+        else:
+            totals = [restaurantFinder_stream(d, site_list)[0] for d in range(solved)]
+
+        self.revenues = [totals[min(d, solved - 1)] for d in range(dmax + 1)]
+
+    def sites(self, d: int) -> List[int]:
+        """
+        Function description:
+        Get the chosen sites for minimum distance d, computing them the first time they are asked for.
+
+        :Input:
+        d: int, a minimum distance between 0 and dmax
+
+        :Output, return or postcondition:
+        The list of chosen sites that are 1-indexed, the same as restaurantFinder(d, site_list) gives.
+
+        :Time complexity:
+        O(N) the first time it is called for a d (or for any d >= N-1), O(K) afterwards where K is the number of
+        chosen sites
+
+        :Aux space complexity:
+        O(N)
+        """
+        if not 0 <= d < len(self.revenues):
+            raise IndexError("d is outside the swept range")
+        d = min(d, len(self.site_list) - 1)
+        if d not in self.chosen_sites:
+            self.chosen_sites[d] = restaurantFinder(d, self.site_list)[1]
+        return list(self.chosen_sites[d])
+
+
+def restaurantFinder_sweep(dmax: int, site_list: List[int]) -> RestaurantSweep:
+    """
+    Function description:
+    Solve restaurantFinder for every minimum distance d from 0 to dmax in one call.
+
+    :Input:
+    dmax: int, the largest minimum distance to solve for
+    site_list: A list of revenues for each site.
+
+    :Output, return or postcondition:
+    A RestaurantSweep whose revenues list holds the maximum total revenue for each d, and whose sites method gives
+    the chosen sites for a d when they are needed.
+
+    :Time complexity:
+    O(N * min(dmax, N)), see RestaurantSweep.
+
+    :Aux space complexity:
+    O(min(dmax, N)^2 + dmax), see RestaurantSweep.
+    """
+    return RestaurantSweep(dmax, site_list)
+
+
+def transfer_matrix(d: int, revenues: List[int]) -> List[List[float]]:
+    """
+    Function description:
+    Build the (max, +) matrix of a run of sites, which maps the last d+1 totals of the recurrence of restaurantFinder
+    before the run to the last d+1 totals after it.
+
+    Approach description:
+    Column c of the matrix is the result of running the recurrence over the sites when the total c sites back is 0
+    and the others are -inf. Like restaurantFinder_stream, the totals are kept in a ring buffer of d+1 entries.
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    revenues: A list (or array) of the revenues of the sites in the run.
+
+    :Output, return or postcondition:
+    The matrix as a list of rows. Entry [r][c] is the best gain from the total c sites back before the run to the
+    total r sites back after it.
+
+    :Time complexity:
+    O(L * d), where L is the number of sites in the run, running d+1 columns over L sites each.
+
+    :Aux space complexity:
+    O(d^2)
+    """
+    L = len(revenues)
+    matrix = [[float('-inf')] * (d + 1) for _ in range(d + 1)]
+    for c in range(d + 1):
+        # window[j % (d+1)] holds the total up to site j, starting with the sites before the run
+        window = [float('-inf')] * (d + 1)
+        window[(-1 - c) % (d + 1)] = 0
+        previous = window[-1 % (d + 1)]
+        for i, revenue in enumerate(revenues):
+            slot = i % (d + 1)
+            previous = max(previous, revenue + window[slot])
+            window[slot] = previous
+        for r in range(d + 1):
+            matrix[r][c] = window[(L - 1 - r) % (d + 1)]
+    return matrix
+
+
+class RestaurantSolver:
+    def __init__(self, d: int, site_list: List[int]):
+        """
+        Function description:
+        Initialize a RestaurantSolver object, which keeps the answer of restaurantFinder(d, site_list) up to date while
+        the revenues of single sites change, and answers restaurantFinder for any range of sites.
+
+        Approach description:
+        The recurrence of restaurantFinder only looks at the last d+1 totals, so processing a site maps the vector of the
+        last d+1 totals to the next one. In (max, +) algebra this map is a (d+1) x (d+1) matrix, and processing a run of
+        sites is the (max, +) product of their matrices. The sites are split into blocks of d+1 sites, and a segment tree
+        stores the matrix of every block and the product of every node's children. Changing one revenue only changes
+        one block and the nodes above it.
+
+        :Input:
+        d: The minimum distance between any two chosen sites.
+        site_list: A list of revenues for each site.
+
+        :Output, return or postcondition:
+        Make an object of instance RestaurantSolver
+
+        :Time complexity:
+        O(N * d^2), where N is the number of sites. There are O(N/d) blocks, and both building a block matrix and
+        multiplying two matrices cost O(d^2) per block of d+1 sites.
+
+        :Aux space complexity:
+        O(N * d), for O(N/d) matrices of (d+1)^2 entries.
+        """
+        self.d = d
+        self.site_list = list(site_list)
+        self.block_size = d + 1
+        blocks = max(1, -(-len(self.site_list) // self.block_size))
+        self.leaves = 1
+        while self.leaves < blocks:
+            self.leaves *= 2
+
+        identity = self.identity()
+        self.tree = [identity] * (2 * self.leaves)
+        for b in range(blocks):
+            self.tree[self.leaves + b] = self.block_matrix(b)
+        for node in range(self.leaves - 1, 0, -1):
+            self.tree[node] = self.multiply(self.tree[2 * node + 1], self.tree[2 * node])
+
+    def identity(self) -> List[List[float]]:
+        """
+        Function description:
+        Get the (max, +) identity matrix, the matrix of an empty run of sites.
+
+        :Time complexity:
+        O(d^2)
+
+        :Aux space complexity:
+        O(d^2)
+        """
+        size = self.d + 1
+        return [[0 if r == c else float('-inf') for c in range(size)] for r in range(size)]
+
+    def block_matrix(self, b: int) -> List[List[float]]:
+        """
+        Function description:
+        Build the (max, +) matrix of block b (see transfer_matrix).
+
+        :Input:
+        b: int, index of the block
+
+        :Time complexity:
+        O(d^2), for a block of d+1 sites.
+
+        :Aux space complexity:
+        O(d^2)
+        """
+        return transfer_matrix(self.d, self.site_list[b * self.block_size:(b + 1) * self.block_size])
+
+    @staticmethod
+    def multiply(later: List[List[float]], earlier: List[List[float]]) -> List[List[float]]:
+        """
+        Function description:
+        Multiply two (max, +) matrices, giving the matrix of running the sites of earlier and then the sites of later.
+
+        :Input:
+        later: the matrix of the sites that come second
+        earlier: the matrix of the sites that come first
+
+        :Output, return or postcondition:
+        The product matrix
+
+        :Time complexity:
+        O(d^3)
+
+        :Aux space complexity:
+        O(d^2)
+        """
+        size = len(earlier)
+        product = []
+        for row in later:
+            product_row = [float('-inf')] * size
+            for k, gain in enumerate(row):
+                if gain == float('-inf'):
+                    continue
+                earlier_row = earlier[k]
+                for c in range(size):
+                    if gain + earlier_row[c] > product_row[c]:
+                        product_row[c] = gain + earlier_row[c]
+            product.append(product_row)
+        return product
+
+    def update(self, i: int, revenue: int):
+        """
+        Function description:
+        Change the revenue of site i.
+
+        :Input:
+        i: int, the 1-indexed site number
+        revenue: int, the new revenue of the site
+
+        :Output, return or postcondition:
+        The revenue is changed and the matrices of its block and of the nodes above it are rebuilt
+
+        :Time complexity:
+        O(d^3 log(N/d)), rebuilding one block and multiplying matrices on the path to the root.
+
+        :Aux space complexity:
+        O(d^2 log(N/d))
+        """
+        if not 1 <= i <= len(self.site_list):
+            raise IndexError("site number out of range")
+        self.site_list[i - 1] = revenue
+        b = (i - 1) // self.block_size
+        self.tree[self.leaves + b] = self.block_matrix(b)
+        node = (self.leaves + b) // 2
+        while node:
+            self.tree[node] = self.multiply(self.tree[2 * node + 1], self.tree[2 * node])
+            node //= 2
+
+    def best(self) -> int:
+        """
+        Function description:
+        Get the maximum total revenue for the current revenues.
+
+        Approach description:
+        Before the first site all totals are 0, so the answer is the best entry of the first row of the root matrix.
+
+        :Output, return or postcondition:
+        The same total revenue as restaurantFinder(d, site_list)
+
+        :Time complexity:
+        O(d)
+
+        :Aux space complexity:
+        O(1)
+        """
+        return max(self.tree[1][0])
+
+    def sites(self) -> List[int]:
+        """
+        Function description:
+        Reconstruct the chosen sites for the current revenues.
+
+        :Output, return or postcondition:
+        The list of chosen sites that are 1-indexed, the same as restaurantFinder(d, site_list) gives.
+
+        :Time complexity:
+        O(N), running restaurantFinder on the current revenues.
+
+        :Aux space complexity:
+        O(N)
+        """
+        if not self.site_list:
+            return []
+        return restaurantFinder(self.d, self.site_list)[1]
+
+    def query(self, l: int, r: int) -> int:
+        """
+        Function description:
+        Get the maximum total revenue when only the sites from l to r can be chosen, the same as
+        restaurantFinder(d, site_list[l-1:r]) gives, without copying the sites.
+
+        Approach description:
+        Before site l all totals are 0, and advance carries them to site r.
+
+        :Input:
+        l: int, the 1-indexed first site of the range
+        r: int, the 1-indexed last site of the range
+
+        :Output, return or postcondition:
+        The maximum total revenue of the range, 0 if the range is empty (l > r)
+
+        :Time complexity:
+        O(d^2 log(N/d)), each matrix is applied to a vector in O(d^2) time.
+
+        :Aux space complexity:
+        O(d + log(N/d))
+        """
+        if l > r:
+            return 0
+        if l < 1 or r > len(self.site_list):
+            raise IndexError("site range out of range")
+        return self.advance([0] * (self.d + 1), l - 1, r)[0]
+
+    def advance(self, totals: List[int], lo: int, hi: int) -> List[int]:
+        """
+        Function description:
+        Carry the last d+1 totals over the sites from lo to hi (0-indexed, hi exclusive).
+
+        Approach description:
+        The sites before the first whole block and after the last whole block are run through the recurrence one at a
+        time. The whole blocks in between are covered by O(log(N/d)) nodes of the segment tree, whose matrices are
+        applied to the vector of the last d+1 totals from left to right.
+
+        :Input:
+        totals: the last d+1 totals before lo, totals[c] is the total c sites back
+        lo, hi: int, the range of sites
+
+        :Output, return or postcondition:
+        The last d+1 totals up to hi
+
+        :Time complexity:
+        O(d^2 log(N/d) + d), each matrix is applied to a vector in O(d^2) time.
+
+        :Aux space complexity:
+        O(d + log(N/d))
+        """
+        first_block = -(-lo // self.block_size)
+        last_block = hi // self.block_size
+
+        if first_block >= last_block:
+            return self.run_sites(totals, lo, hi)
+
+        totals = self.run_sites(totals, lo, first_block * self.block_size)
+        left, right = first_block + self.leaves, last_block + self.leaves
+        right_nodes = []
+        while left < right:
+            if left & 1:
+                totals = self.apply(self.tree[left], totals)
+                left += 1
+            if right & 1:
+                right -= 1
+                right_nodes.append(self.tree[right])
+            left //= 2
+            right //= 2
+        for matrix in reversed(right_nodes):
+            totals = self.apply(matrix, totals)
+        return self.run_sites(totals, last_block * self.block_size, hi)
+
+    def query_sites(self, l: int, r: int) -> Tuple[int, List[int]]:
+        """
+        Function description:
+        Get the maximum total revenue and the chosen sites when only the sites from l to r can be chosen.
+
+        :Input:
+        l: int, the 1-indexed first site of the range
+        r: int, the 1-indexed last site of the range
+
+        :Output, return or postcondition:
+        The same tuple as restaurantFinder(d, site_list[l-1:r]), with the chosen sites numbered as in the whole
+        site_list
+
+        :Time complexity:
+        O(r - l), running restaurantFinder on the range.
+
+        :Aux space complexity:
+        O(r - l)
+        """
+        if l > r:
+            return (0, [])
+        if l < 1 or r > len(self.site_list):
+            raise IndexError("site range out of range")
+        total, sites = restaurantFinder(self.d, self.site_list[l - 1:r])
+        return (total, [site + l - 1 for site in sites])
+
+    def query_many(self, ranges: Iterable[Tuple[int, int]]) -> List[int]:
+        """
+        Function description:
+        Answer query for many ranges in one call.
+
+        Approach description:
+        The ranges are answered offline, sorted by their first site and then by their last site. All ranges starting
+        at the same site share one vector of totals, which is advanced from the end of one range to the end of the
+        next instead of from the first site again. Ranges that share no first site cost the same as calling query on
+        each of them.
+
+        :Input:
+        ranges: an iterable of (l, r) ranges of 1-indexed sites
+
+        :Output, return or postcondition:
+        The list of maximum total revenues, in the same order as ranges
+
+        :Time complexity:
+        O(Q log Q + Q * d^2 log(N/d)), where Q is the number of ranges.
+
+        :Aux space complexity:
+        O(Q + d + log(N/d))
+        """
+        ranges = list(ranges)
+        answers = [0] * len(ranges)
+        for l, r in ranges:
+            if l <= r and (l < 1 or r > len(self.site_list)):
+                raise IndexError("site range out of range")
+
+        totals, start, end = None, None, None
+        for index in sorted((index for index, (l, r) in enumerate(ranges) if l <= r), key=lambda index: ranges[index]):
+            l, r = ranges[index]
+            if l != start:
+                totals, start, end = [0] * (self.d + 1), l, l - 1
+            totals = self.advance(totals, end, r)
+            end = r
+            answers[index] = totals[0]
+        return answers
+
+    def run_sites(self, totals: List[int], start: int, end: int) -> List[int]:
+        """
+        Function description:
+        Run the recurrence over the sites from start to end (0-indexed, end exclusive) one site at a time.
+
+        :Input:
+        totals: the last d+1 totals before start, totals[c] is the total c sites back
+        start: int, the first site to run
+        end: int, one past the last site to run
+
+        :Output, return or postcondition:
+        The last d+1 totals after end
+
+        :Time complexity:
+        O((end - start) * d)
+
+        :Aux space complexity:
+        O(d)
+        """
+        d = self.d
+        for revenue in self.site_list[start:end]:
+            totals = [max(totals[0], revenue + totals[d])] + totals[:d]
+        return totals
+
+    @staticmethod
+    def apply(matrix: List[List[float]], totals: List[int]) -> List[int]:
+        """
+        Function description:
+        Apply the (max, +) matrix of a run of sites to the last d+1 totals before the run.
+
+        :Time complexity:
+        O(d^2)
+
+        :Aux space complexity:
+        O(d)
+        """
+        return [max(gain + total for gain, total in zip(row, totals)) for row in matrix]
+
+
+def restaurantFinder_positions(d: float, sites: List[Tuple[float, int]]) -> Tuple[int, List[int]]:
+    """
+    Function description:
+    Same as restaurantFinder, but every site has its own position along the highway instead of the sites being 1 km
+    apart. No two chosen sites can be within d km of each other, that is, the positions of any two chosen sites must
+    differ by more than d.
+
+    Approach description:
+    The sites are sorted by position (a sorted list is recognised by the sort in O(N) time). In that order, the last
+    site that is more than d km before the current site only moves forward, so it is found with a second pointer. The
+    recurrence is then the same as restaurantFinder with that site in place of the site d+1 positions back. With
+    positions 1, 2, ..., N the result is identical to restaurantFinder.
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    sites: A list of (position, revenue) pairs, in any order.
+
+    :Output, return or postcondition:
+    A tuple with the maximum total revenue and the list of the chosen sites, given as 1-indexed positions in the sites
+    list, in order of position.
+
+    :Time complexity:
+    O(N log N) for the sort, where N is the number of sites, O(N) if the sites are already sorted by position.
+
+    :Aux space complexity:
+    O(N)
+    """
+    N = len(sites)
+    order = sorted(range(N), key=lambda i: sites[i][0])
+    total_revenue = [0]*N
+    previous_site = array('q', bytes(8*N))
+    taken = array('b', bytes(N))
+
+    j = 0
+    for k in range(N):
+        position, revenue = sites[order[k]]
+        while position - sites[order[j]][0] > d:
+            j += 1
+        previous_site[k] = j - 1  # the last site more than d km before the current one, -1 if there is none
+
+        include_site = revenue + (total_revenue[j-1] if j > 0 else 0)
+        exclude_site = total_revenue[k-1] if k > 0 else 0
+        if include_site > exclude_site:
+            total_revenue[k] = include_site
+            taken[k] = 1
+        else:
+            total_revenue[k] = exclude_site
+
+    chosen_sites = []
+    k = N - 1
+    while k >= 0:
+        if taken[k]:
+            chosen_sites.append(order[k] + 1)
+            k = previous_site[k]
+        else:
+            k -= 1
+    chosen_sites.reverse()
+
+    return (total_revenue[-1] if N else 0, chosen_sites)
+
+
+def check_integer_revenues(site_list: List[int]):
+    """
+    Function description:
+    Check that every revenue is an integer, as restaurantFinder_max_sites needs.
+
+    :Output, return or postcondition:
+    TypeError is raised for the first revenue that is not an integer.
+
+    :Time complexity:
+    O(N), where N is the number of sites.
+
+    :Aux space complexity:
+    O(1)
+    """
+    for revenue in site_list:
+        if not isinstance(revenue, numbers.Integral):
+            raise TypeError(f"max_sites needs integer revenues, got {revenue!r}")
+
+
+def penalised_totals(d: int, site_list: List[int], penalty: int) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Function description:
+    Run the recurrence of restaurantFinder when every chosen site costs an extra penalty, keeping track of how many
+    sites the best selections use.
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    site_list: A list of revenues for each site.
+    penalty: int, the amount taken off the revenue of every chosen site
+
+    :Output, return or postcondition:
+    A tuple of three lists, each with one entry per site: the best penalised total up to the site, and the fewest
+    and the most sites used by a selection reaching that total.
+
+    :Time complexity:
+    O(N), where N is the number of sites.
+
+    :Aux space complexity:
+    O(N)
+    """
+    N = len(site_list)
+    total_revenue = [0]*N
+    fewest_sites = [0]*N
+    most_sites = [0]*N
+
+    for i in range(N):
+        previous = i-d-1
+        include_site = site_list[i] - penalty + (total_revenue[previous] if previous >= 0 else 0)
+        include_fewest = (fewest_sites[previous] if previous >= 0 else 0) + 1
+        include_most = (most_sites[previous] if previous >= 0 else 0) + 1
+        exclude_site = total_revenue[i-1] if i > 0 else 0
+        exclude_fewest = fewest_sites[i-1] if i > 0 else 0
+        exclude_most = most_sites[i-1] if i > 0 else 0
+
+        if include_site > exclude_site:
+            total_revenue[i], fewest_sites[i], most_sites[i] = include_site, include_fewest, include_most
+        elif include_site < exclude_site:
+            total_revenue[i], fewest_sites[i], most_sites[i] = exclude_site, exclude_fewest, exclude_most
+        else:
+            total_revenue[i] = exclude_site
+            fewest_sites[i] = min(include_fewest, exclude_fewest)
+            most_sites[i] = max(include_most, exclude_most)
+
+    return (total_revenue, fewest_sites, most_sites)
+
+
+def restaurantFinder_max_sites(d: int, site_list: List[int], max_sites: int) -> Tuple[int, List[int]]:
+    """
+    Function description:
+    Same as restaurantFinder, but at most max_sites restaurants can be opened.
+
+    Approach description:
+    The best total revenue with exactly k sites is concave in k, so it can be found with Lagrangian relaxation (the
+    "Aliens trick"). Every chosen site pays a penalty, and the recurrence of restaurantFinder is run without a limit
+    (see penalised_totals). A larger penalty never makes the best selections use more sites, so the penalty is binary
+    searched for the smallest one where a best selection uses at most max_sites sites. At that penalty the number of
+    sites used by the best selections covers a range that contains the target, so the sites are rebuilt backwards,
+    only following include/exclude decisions that can still reach the target number of sites. The revenues have to be
+    integers, so that only integer penalties need to be tried; TypeError is raised otherwise, since other revenues could
+    need a penalty between two integers.
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    site_list: A list of integer revenues for each site.
+    max_sites: int, the largest number of sites that can be chosen
+
+    :Output, return or postcondition:
+    A tuple with the maximum total revenue using at most max_sites sites and a list of the chosen sites that are
+    1-indexed.
+
+    :Time complexity:
+    O(N log R), where N is the number of sites and R is the largest revenue.
+
+    :Aux space complexity:
+    O(N)
+    """
+    check_integer_revenues(site_list)
+    N = len(site_list)
+    low, high = 0, max(0, max(site_list, default=0)) + 1
+    while low < high:
+        penalty = (low + high) // 2
+        if penalised_totals(d, site_list, penalty)[1][-1] <= max_sites:
+            high = penalty
+        else:
+            low = penalty + 1
+    total_revenue, fewest_sites, most_sites = penalised_totals(d, site_list, low)
+
+    # Walk back from the last site, keeping the number of sites still to choose reachable
+    chosen_sites = []
+    target = min(max_sites, most_sites[-1]) if N else 0
+    i = N-1
+    while i >= 0 and target > 0:
+        previous = i-d-1
+        exclude_site = total_revenue[i-1] if i > 0 else 0
+        if exclude_site == total_revenue[i] and (fewest_sites[i-1] if i > 0 else 0) <= target <= \
+                (most_sites[i-1] if i > 0 else 0):
+            i -= 1
+        else:
+            chosen_sites.append(i+1)  # Convert to 1-indexed sites
+            target -= 1
+            i = previous
+    chosen_sites.reverse()
+
+    return (sum(site_list[site-1] for site in chosen_sites), chosen_sites)
+
+
+# Binary site file: the 8 byte magic, the number of sites N as a little-endian unsigned 64 bit integer, then the N
+# revenues as little-endian signed 64 bit integers.
+SITE_FILE_MAGIC = b'RFSITES1'
+SITE_FILE_HEADER = struct.Struct('<8sQ')
+
+
+def write_site_file(path: str, revenues: Iterable[int]) -> int:
+    """
+    Function description:
+    Write revenues to a binary site file that restaurantFinder_file can read.
+
+    Approach description:
+    The file starts with a 16 byte header: the magic b'RFSITES1' and the number of sites as a little-endian unsigned
+    64 bit integer. It is followed by one little-endian signed 64 bit integer per site. The revenues are written in
+    chunks as they come from the iterable, and the number of sites is filled into the header at the end.
+
+    :Input:
+    path: str, path of the file to write
+    revenues: An iterable of integer revenues for each site, each fitting in 64 bits.
+
+    :Output, return or postcondition:
+    The file is written and the number of sites is returned
+
+    :Time complexity:
+    O(N), where N is the number of sites.
+
+    :Aux space complexity:
+    O(1), the revenues are buffered one chunk at a time.
+    """
+    count = 0
+    with open(path, 'wb') as file:
+        file.write(SITE_FILE_HEADER.pack(SITE_FILE_MAGIC, 0))
+        iterator = iter(revenues)
+        while True:
+            chunk = array('q', itertools.islice(iterator, 1 << 16))
+            if not chunk:
+                break
+            if sys.byteorder == 'big':
+                chunk.byteswap()
+            file.write(chunk.tobytes())
+            count += len(chunk)
+        file.seek(0)
+        file.write(SITE_FILE_HEADER.pack(SITE_FILE_MAGIC, count))
+    return count
+
+
+def convert_sites_to_binary(source: str, destination: str) -> int:
+    """
+    Function description:
+    Convert revenues from a JSON or CSV file into a binary site file (see write_site_file).
+
+    Approach description:
+    A source ending in .json must hold a JSON list of revenues. Any other source is read as CSV, one line at a time,
+    and every non-empty field is a revenue, so both one revenue per line and comma separated lines work.
+
+    :Input:
+    source: str, path of the JSON or CSV file
+    destination: str, path of the binary site file to write
+
+    :Output, return or postcondition:
+    The binary site file is written and the number of sites is returned
+
+    :Time complexity:
+    O(N), where N is the number of sites.
+
+    :Aux space complexity:
+    O(N) for JSON, which is loaded whole, O(1) for CSV.
+    """
+    if source.lower().endswith('.json'):
+        with open(source) as file:
+            return write_site_file(destination, json.load(file))
+    with open(source, newline='') as file:
+        revenues = (int(field) for row in csv.reader(file) for field in row if field.strip())
+        return write_site_file(destination, revenues)
+
+
+def restaurantFinder_file(d: int, path: str) -> Tuple[int, List[int]]:
+    """
+    Function description:
+    Same as restaurantFinder, but the revenues are read from a binary site file (see write_site_file).
+
+    Approach description:
+    The file is memory-mapped and the revenues are read through a memoryview of the mapping, so no Python list of the
+    revenues is built and only the pages being read need to be in memory. The view is passed to
+    restaurantFinder_stream, which only keeps d+1 totals and one bit per site. The views are released by with blocks, so
+    an exception raised by the search reaches the caller unchanged.
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    path: str, path of the binary site file
+
+    :Output, return or postcondition:
+    A tuple with the maximum total revenue and a list of the chosen sites that are 1-indexed, the same as
+    restaurantFinder gives for the revenues in the file.
+
+    :Time complexity:
+    O(N), where N is the number of sites.
+
+    :Aux space complexity:
+    O(min(d, N) + N/8 + K), where K is the number of chosen sites.
+    """
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+        if len(mapping) < SITE_FILE_HEADER.size:
+            raise ValueError("not a binary site file")
+        magic, count = SITE_FILE_HEADER.unpack_from(mapping)
+        if magic != SITE_FILE_MAGIC or len(mapping) != SITE_FILE_HEADER.size + 8 * count:
+            raise ValueError("not a binary site file")
+        with memoryview(mapping) as view, view[SITE_FILE_HEADER.size:] as data:
+            if sys.byteorder == 'little':
+                with data.cast('q') as revenues:
+                    return restaurantFinder_stream(d, revenues)
+
+            def swapped_revenues():
+                # Copy and swap a chunk at a time, so no view of the mapping is still exported if the search stops
+                for start in range(0, len(data), 8 << 16):
+                    chunk = array('q', data[start:start + (8 << 16)].tobytes())
+                    chunk.byteswap()
+                    yield from chunk
+            return restaurantFinder_stream(d, swapped_revenues())
+
+
+def pack_revenues(site_list: Iterable[int]):
+    """
+    Function description:
+    Pack revenues into an array of 64 bit integers, which is much smaller to store and to send to another process than
+    a list of Python ints.
+
+    :Input:
+    site_list: An iterable of revenues for each site.
+
+    :Output, return or postcondition:
+    An array('q') of the revenues, or a list if some revenue is not an integer that fits in 64 bits.
+
+    :Time complexity:
+    O(N), where N is the number of sites.
+
+    :Aux space complexity:
+    O(N)
+    """
+    site_list = list(site_list) if not isinstance(site_list, (list, array)) else site_list
+    try:
+        return array('q', site_list)
+    except (OverflowError, TypeError):
+        return list(site_list)
+
+
+def chunk_decisions(d: int, revenues: List[int], totals: List[int]) -> array:
+    """
+    Function description:
+    Run the recurrence of restaurantFinder over a chunk of sites, starting from the totals before the chunk.
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    revenues: The revenues of the sites in the chunk.
+    totals: The last d+1 totals before the chunk, totals[c] is the total c sites back.
+
+    :Output, return or postcondition:
+    An array with the include/exclude decision of each site in the chunk
+
+    :Time complexity:
+    O(L), where L is the number of sites in the chunk.
+
+    :Aux space complexity:
+    O(L + d)
+    """
+    taken = array('b', bytes(len(revenues)))
+    window = [totals[(-1 - j) % (d + 1)] for j in range(d + 1)]  # window[j % (d+1)] is the total up to site j
+    previous = totals[0]
+    for i, revenue in enumerate(revenues):
+        slot = i % (d + 1)
+        include_site = revenue + window[slot]
+        if include_site > previous:
+            previous = include_site
+            taken[i] = 1
+        window[slot] = previous
+    return taken
+
+
+def chunk_exits(d: int, revenues: List[int], totals: List[int], start: int) -> dict:
+    """
+    Function description:
+    For every site where the backward walk of reconstruct_sites can enter a chunk from the right, find the site where
+    it leaves the chunk to the left.
+
+    Approach description:
+    The walk moves back by at most d+1 sites, so it enters a chunk at one of its last d+1 sites. The walk is followed
+    from each of them, stopping early at a site already reached by an earlier walk, because from there the walks are
+    the same.
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    revenues: The revenues of the sites in the chunk.
+    totals: The last d+1 totals before the chunk, totals[c] is the total c sites back.
+    start: int, the 0-indexed site where the chunk starts
+
+    :Output, return or postcondition:
+    A dictionary from each entry site to the exit site (both 0-indexed), the exit being before start.
+
+    :Time complexity:
+    O(L), where L is the number of sites in the chunk.
+
+    :Aux space complexity:
+    O(L)
+    """
+    taken = chunk_decisions(d, revenues, totals)
+    end = start + len(revenues)
+    exit_of = {}
+    for entry in range(max(start, end - d - 1), end):
+        walk = []
+        i = entry
+        while i >= start and i not in exit_of:
+            walk.append(i)
+            i -= d + 1 if taken[i - start] else 1
+        exit_site = exit_of.get(i, i)
+        for i in walk:
+            exit_of[i] = exit_site
+    return {entry: exit_of[entry] for entry in range(max(start, end - d - 1), end)}
+
+
+def chunk_sites(d: int, revenues: List[int], totals: List[int], start: int, entry: int) -> List[int]:
+    """
+    Function description:
+    Get the chosen sites of a chunk, walking back from the site where the walk of reconstruct_sites enters it.
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    revenues: The revenues of the sites in the chunk.
+    totals: The last d+1 totals before the chunk, totals[c] is the total c sites back.
+    start: int, the 0-indexed site where the chunk starts
+    entry: int, the 0-indexed site where the walk enters the chunk
+
+    :Output, return or postcondition:
+    The list of chosen sites in the chunk, 1-indexed and in increasing order
+
+    :Time complexity:
+    O(L), where L is the number of sites in the chunk.
+
+    :Aux space complexity:
+    O(L)
+    """
+    taken = chunk_decisions(d, revenues, totals)
+    return [site + start for site in reconstruct_sites(d, taken[:entry - start + 1])]
+
+
+def restaurantFinder_parallel(d: int, site_list: List[int], workers: Optional[int] = None,
+                              chunk_size: Optional[int] = None) -> Tuple[int, List[int]]:
+    """
+    Function description:
+    Same as restaurantFinder, but the work is split over a pool of processes.
+
+    Approach description:
+    The site_list is split into chunks of at least d+1 sites. Like RestaurantSolver, every chunk is described by the
+    (max, +) matrix that maps the last d+1 totals before it to the last d+1 totals after it, and the workers build
+    these matrices in parallel (see transfer_matrix). A prefix scan over the matrices then gives the totals entering
+    every chunk. Because the backward walk of reconstruct_sites moves back by at most d+1 sites, it enters a chunk at
+    one of its last d+1 sites, and the workers find in parallel where the walk leaves each chunk for each of those
+    entries (see chunk_exits). Linking those from the last chunk gives the real entry of every chunk, and the workers
+    then collect the chosen sites of their chunks (see chunk_sites). Every chunk makes the same decisions as
+    restaurantFinder, so the result is identical.
+
+    Building a matrix runs the recurrence d+1 times over the chunk, so the whole scan does about d+3 times the work of
+    restaurantFinder, and every matrix holds (d+1)^2 totals. It can only be faster when d+3 is below the number of
+    workers, so otherwise, or when a matrix would be bigger than its chunk, restaurantFinder is run instead.
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    site_list: A list of revenues for each site.
+    workers: Optional, the number of processes, by default the number of CPUs
+    chunk_size: Optional, the number of sites per chunk, by default an equal share per worker
+
+    :Output, return or postcondition:
+    The same tuple as restaurantFinder(d, site_list)
+
+    :Time complexity:
+    O(N * d / P + C * d^2), where N is the number of sites, P is the number of workers and C is the number of chunks.
+    O(N) when it falls back to restaurantFinder.
+
+    :Aux space complexity:
+    O(N + C * d^2), where C * d^2 is at most N
+    """
+    N = len(site_list)
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(chunk_size or -(-N // workers), d + 1)
+    if chunk_size >= N or d + 3 >= workers or (d + 1) ** 2 > chunk_size:
+        return restaurantFinder(d, site_list)
+
+    starts = list(range(0, N, chunk_size))
+    chunks = [pack_revenues(site_list[start:start + chunk_size]) for start in starts]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        matrices = list(executor.map(transfer_matrix, [d] * len(chunks), chunks))
+
+        entering_totals = [[0] * (d + 1)]
+        for matrix in matrices:
+            entering_totals.append(RestaurantSolver.apply(matrix, entering_totals[-1]))
+        total_revenue = entering_totals.pop()[0]
+
+        exits = list(executor.map(chunk_exits, [d] * len(chunks), chunks, entering_totals, starts))
+        entries = [None] * len(chunks)
+        entry = N - 1
+        for k in range(len(chunks) - 1, -1, -1):
+            if entry < 0:
+                break
+            entries[k] = entry
+            entry = exits[k][entry]
+
+        walked = [k for k in range(len(chunks)) if entries[k] is not None]
+        chosen_sites = executor.map(chunk_sites, [d] * len(walked), [chunks[k] for k in walked],
+                                    [entering_totals[k] for k in walked], [starts[k] for k in walked],
+                                    [entries[k] for k in walked])
+        chosen_sites = [site for sites in chosen_sites for site in sites]
+
+    return (total_revenue, chosen_sites)
+
+
+def restaurantFinder_jobs(jobs: List[Tuple[int, List[int]]]) -> List[Tuple[int, array]]:
+    """
+    Function description:
+    Run restaurantFinder on a batch of jobs, used by restaurantFinder_many in the worker processes.
+
+    :Input:
+    jobs: A list of (d, site_list) jobs.
+
+    :Output, return or postcondition:
+    A list with the result of each job, the chosen sites packed in an array('q')
+
+    :Time complexity:
+    O(total number of sites in the jobs)
+
+    :Aux space complexity:
+    O(largest number of sites in a job)
+    """
+    results = []
+    for d, site_list in jobs:
+        total_revenue, chosen_sites = restaurantFinder(d, site_list)
+        results.append((total_revenue, array('q', chosen_sites)))
+    return results
+
+
+def restaurantFinder_many(jobs: Iterable[Tuple[int, List[int]]], workers: Optional[int] = None,
+                          batch_size: int = 64) -> Iterable[Tuple[int, List[int]]]:
+    """
+    Function description:
+    Run restaurantFinder on many independent (d, site_list) jobs using a pool of processes.
+
+    Approach description:
+    The jobs are read lazily and grouped into batches of batch_size jobs, with the revenues packed into compact arrays
+    (see pack_revenues). At most two batches per worker are in flight at a time, so an iterator of jobs is never read
+    far ahead. The results are yielded as soon as they are ready, in the same order as the jobs.
+
+    :Input:
+    jobs: An iterable of (d, site_list) jobs.
+    workers: Optional, the number of processes, by default the number of CPUs
+    batch_size: int, the number of jobs sent to a worker at a time
+
+    :Output, return or postcondition:
+    A generator of the restaurantFinder(d, site_list) result of each job, in order
+
+    :Time complexity:
+    O(S / P), where S is the total number of sites in the jobs and P is the number of workers.
+
+    :Aux space complexity:
+    O(P * batch_size * largest number of sites in a job)
+    """
+    workers = workers or os.cpu_count() or 1
+    jobs = iter(jobs)
+    batches = iter(lambda: [(d, pack_revenues(site_list)) for d, site_list in itertools.islice(jobs, batch_size)], [])
+    if workers == 1:
+        for batch in batches:
+            for total_revenue, chosen_sites in restaurantFinder_jobs(batch):
+                yield (total_revenue, chosen_sites.tolist())
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = collections.deque()
+        for batch in itertools.islice(batches, 2 * workers):
+            in_flight.append(executor.submit(restaurantFinder_jobs, batch))
+        while in_flight:
+            results = in_flight.popleft().result()
+            for batch in itertools.islice(batches, 1):
+                in_flight.append(executor.submit(restaurantFinder_jobs, batch))
+            for total_revenue, chosen_sites in results:
+                yield (total_revenue, chosen_sites.tolist())
+
+
+class RestaurantCache:
+    def __init__(self, max_bytes: int = 64 << 20, path: Optional[str] = None):
+        """
+        Function description:
+        Initialize a RestaurantCache object, an opt-in cache of restaurantFinder results keyed by d and the revenues.
+
+        Approach description:
+        The key is a BLAKE2b hash of d and the revenues packed as 64 bit integers (see pack_revenues). Results are kept
+        in memory in least recently used order, and the oldest ones are evicted once their estimated size goes over
+        max_bytes. If a path is given, results are also stored in an sqlite database there, which survives restarts and
+        is looked up when a result is not in memory.
+
+        :Input:
+        max_bytes: int, the most bytes of results to keep in memory
+        path: Optional, path of the sqlite database of the disk tier
+
+        :Output, return or postcondition:
+        Make an object of instance RestaurantCache, with the hits, disk_hits, misses and evictions counters at 0
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries = collections.OrderedDict()
+        self.hits = self.disk_hits = self.misses = self.evictions = 0
+        self.database = None
+        if path is not None:
+            self.database = sqlite3.connect(path)
+            self.database.execute("CREATE TABLE IF NOT EXISTS results (key BLOB PRIMARY KEY, total TEXT, sites BLOB)")
+            self.database.commit()
+
+    @staticmethod
+    def key(d: int, site_list: List[int]) -> bytes:
+        """
+        Function description:
+        Hash d and the revenues into the cache key.
+
+        :Time complexity:
+        O(N), where N is the number of sites.
+
+        :Aux space complexity:
+        O(N), for the packed revenues.
+        """
+        revenues = pack_revenues(site_list)
+        digest = hashlib.blake2b(struct.pack('<q', d), digest_size=16)
+        if isinstance(revenues, array):
+            if sys.byteorder == 'big':
+                revenues.byteswap()
+            digest.update(b'q' + revenues.tobytes())
+        else:
+            digest.update(b'r' + repr(revenues).encode())
+        return digest.digest()
+
+    def restaurantFinder(self, d: int, site_list: List[int]) -> Tuple[int, List[int]]:
+        """
+        Function description:
+        Get restaurantFinder(d, site_list), from the cache if it has been computed before.
+
+        :Input:
+        d: The minimum distance between any two chosen sites.
+        site_list: A list of revenues for each site.
+
+        :Output, return or postcondition:
+        The same tuple as restaurantFinder(d, site_list). The counters are updated and the result is cached.
+
+        :Time complexity:
+        O(N) on a hit, for the key, and the time of restaurantFinder on a miss.
+
+        :Aux space complexity:
+        O(N)
+        """
+        key = self.key(d, site_list)
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            total_revenue, chosen_sites = self.entries[key]
+            return (total_revenue, chosen_sites.tolist())
+
+        if self.database is not None:
+            row = self.database.execute("SELECT total, sites FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self.disk_hits += 1
+                chosen_sites = array('q', row[1])
+                if sys.byteorder == 'big':
+                    chosen_sites.byteswap()
+                total_revenue = json.loads(row[0])
+                self.remember(key, total_revenue, chosen_sites)
+                return (total_revenue, chosen_sites.tolist())
+
+        self.misses += 1
+        total_revenue, chosen_sites = restaurantFinder(d, site_list)
+        self.remember(key, total_revenue, array('q', chosen_sites))
+        if self.database is not None:
+            stored_sites = array('q', chosen_sites)
+            if sys.byteorder == 'big':
+                stored_sites.byteswap()
+            self.database.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                                  (key, json.dumps(total_revenue), stored_sites.tobytes()))
+            self.database.commit()
+        return (total_revenue, chosen_sites)
+
+    def remember(self, key: bytes, total_revenue: int, chosen_sites: array):
+        """
+        Function description:
+        Put a result in the memory tier, evicting the least recently used results while it is over max_bytes.
+
+        :Time complexity:
+        Amortised O(1)
+
+        :Aux space complexity:
+        O(K), where K is the number of chosen sites.
+        """
+        self.entries[key] = (total_revenue, chosen_sites)
+        self.size += self.entry_size(chosen_sites)
+        while self.size > self.max_bytes and self.entries:
+            _, (_, evicted_sites) = self.entries.popitem(last=False)
+            self.size -= self.entry_size(evicted_sites)
+            self.evictions += 1
+
+    @staticmethod
+    def entry_size(chosen_sites: array) -> int:
+        """
+        Function description:
+        Estimate the bytes taken by a cached result: the key, the total, the entry itself and the packed sites.
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        return 160 + chosen_sites.itemsize * len(chosen_sites)
+
+    def stats(self) -> dict:
+        """
+        Function description:
+        Get the counters of the cache.
+
+        :Output, return or postcondition:
+        A dictionary with the hits, disk_hits, misses and evictions counters, and the number and estimated bytes of
+        the results in memory
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        return {'hits': self.hits, 'disk_hits': self.disk_hits, 'misses': self.misses, 'evictions': self.evictions,
+                'entries': len(self.entries), 'bytes': self.size}
+
+    def close(self):
+        """
+        Function description:
+        Close the database of the disk tier, if there is one.
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        if self.database is not None:
+            self.database.close()
+            self.database = None
+
+
+def restaurant_totals(d: int, site_list: List[int]) -> List[int]:
+    """
+    Function description:
+    Get the best total revenue up to each site, the table that restaurantFinder fills in.
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    site_list: A list of revenues for each site.
+
+    :Output, return or postcondition:
+    A list whose entry i is the maximum total revenue using only the sites up to i (0-indexed)
+
+    :Time complexity:
+    O(N), where N is the number of sites.
+
+    :Aux space complexity:
+    O(N)
+    """
+    total_revenue = [0]*len(site_list)
+    for i, revenue in enumerate(site_list):
+        include_site = revenue + (total_revenue[i-d-1] if i-d-1 >= 0 else 0)
+        exclude_site = total_revenue[i-1] if i > 0 else 0
+        total_revenue[i] = max(include_site, exclude_site)
+    return total_revenue
+
+
+class RestaurantWhatIf:
+    def __init__(self, d: int, site_list: List[int]):
+        """
+        Function description:
+        Initialize a RestaurantWhatIf object, which answers how much total revenue is possible when a site is forced
+        to open or forced to stay closed.
+
+        Approach description:
+        The best totals up to each site come from the table of restaurantFinder, and the best totals from each site to
+        the end come from the same table on the reversed sites. If site i is forced to open, the best plan is site i
+        plus the best plans before site i-d and after site i+d. If site i is forced to stay closed, the chosen sites
+        before and after it are more than d apart, so there is a run of L = max(d, 1) unchosen sites containing site i
+        with the best plan before the run on one side and the best plan after it on the other side. The best of those
+        runs is a sliding window maximum over the L runs containing each site, found for all sites at once with a
+        monotone deque.
+
+        :Input:
+        d: The minimum distance between any two chosen sites.
+        site_list: A list of revenues for each site.
+
+        :Output, return or postcondition:
+        Make an object of instance RestaurantWhatIf
+
+        :Time complexity:
+        O(N), where N is the number of sites.
+
+        :Aux space complexity:
+        O(N)
+        """
+        self.d = d
+        self.site_list = site_list
+        N = len(site_list)
+        self.before = restaurant_totals(d, site_list)  # best total of the sites up to i
+        self.after = restaurant_totals(d, site_list[::-1])[::-1]  # best total of the sites from i
+        self.optimum = self.before[-1] if N else 0
+
+        # Run value of the unchosen run of L sites starting at t, for t from 1-L to N-1
+        L = max(d, 1)
+        self.excluded = [0]*N
+        window = collections.deque()
+        for t in range(1 - L, N):
+            value = self.total_before(t - 1) + self.total_after(t + L)
+            while window and window[-1][1] <= value:
+                window.pop()
+            window.append((t, value))
+            if window[0][0] < t - L + 1:
+                window.popleft()
+            if t >= 0:
+                self.excluded[t] = window[0][1]  # the runs containing site t start from t-L+1 to t
+
+    def total_before(self, i: int) -> int:
+        """
+        Function description:
+        Get the best total revenue of the sites up to i (0-indexed), 0 if i is before the first site.
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        return self.before[i] if i >= 0 else 0
+
+    def total_after(self, i: int) -> int:
+        """
+        Function description:
+        Get the best total revenue of the sites from i (0-indexed), 0 if i is after the last site.
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        return self.after[i] if i < len(self.after) else 0
+
+    def forced_in(self, site: int) -> int:
+        """
+        Function description:
+        Get the maximum total revenue when the given site must open.
+
+        :Input:
+        site: int, the 1-indexed site number
+
+        :Output, return or postcondition:
+        The maximum total revenue of the plans that include the site. IndexError is raised for a site outside 1..N.
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        if not 1 <= site <= len(self.site_list):
+            raise IndexError("site number out of range")
+        i = site - 1
+        return self.site_list[i] + self.total_before(i - self.d - 1) + self.total_after(i + self.d + 1)
+
+    def forced_out(self, site: int) -> int:
+        """
+        Function description:
+        Get the maximum total revenue when the given site must stay closed.
+
+        :Input:
+        site: int, the 1-indexed site number
+
+        :Output, return or postcondition:
+        The maximum total revenue of the plans that do not include the site. IndexError is raised for a site outside
+        1..N.
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        if not 1 <= site <= len(self.site_list):
+            raise IndexError("site number out of range")
+        return self.excluded[site - 1]
+
+    def threshold(self, site: int) -> int:
+        """
+        Function description:
+        Get the revenue at which the given site enters the optimum.
+
+        :Input:
+        site: int, the 1-indexed site number
+
+        :Output, return or postcondition:
+        The smallest revenue of the site for which some best plan includes it. Above it every best plan includes the
+        site, below it none does. IndexError is raised for a site outside 1..N.
+
+        :Time complexity:
+        O(1)
+
+        :Aux space complexity:
+        O(1)
+        """
+        return self.forced_out(site) - (self.forced_in(site) - self.site_list[site - 1])
+
+    def report(self) -> List[Tuple[int, int, int, int]]:
+        """
+        Function description:
+        Get the sensitivity of every site.
+
+        :Output, return or postcondition:
+        A list with a (site, forced_in, forced_out, threshold) tuple for each 1-indexed site
+
+        :Time complexity:
+        O(N), where N is the number of sites.
+
+        :Aux space complexity:
+        O(N)
+        """
+        return [(site, self.forced_in(site), self.forced_out(site), self.threshold(site))
+                for site in range(1, len(self.site_list) + 1)]
+
+
+def merge_heaps(first: Optional[tuple], second: Optional[tuple]) -> Optional[tuple]:
+    """
+    Function description:
+    Merge two persistent leftist min-heaps without changing either of them.
+
+    Approach description:
+    A heap node is the tuple (key, item, left, right, rank), where rank is the length of the rightmost path. The root
+    with the smaller key is kept, its right child is merged with the other heap, and the children are swapped if
+    needed so that the left child has the larger rank. Only the nodes on the rightmost paths are copied.
+
+    :Input:
+    first: a heap node, or None for an empty heap
+    second: a heap node, or None for an empty heap
+
+    :Output, return or postcondition:
+    The root of the merged heap
+
+    :Time complexity:
+    O(log(n)), where n is the number of nodes in the heaps.
+
+    :Aux space complexity:
+    O(log(n)) new nodes.
+    """
+    if first is None:
+        return second
+    if second is None:
+        return first
+    if second[0] < first[0]:
+        first, second = second, first
+    key, item, left, right, _ = first
+    right = merge_heaps(right, second)
+    if left is None or left[4] < right[4]:
+        left, right = right, left
+    return (key, item, left, right, (right[4] if right is not None else 0) + 1)
+
+
+def restaurantFinder_plans(d: int, site_list: List[int]) -> Iterable[Tuple[int, List[int]]]:
+    """
+    Function description:
+    Generate every valid selection of sites in decreasing order of total revenue, starting with the plan of
+    restaurantFinder. Plans with the same total revenue all come out, in no particular order.
+
+    Approach description:
+    A plan is a path in a DAG over the number of sites still to decide, from N down to 0. From j sites either site j is
+    skipped, going to j-1, or it is chosen, going to j-d-1 (or 0). The best totals of restaurantFinder make the best
+    edge out of every j a tree, and the other edge is a sidetrack that loses a fixed amount of revenue. Every plan is the
+    tree path with a sequence of sidetracks, each one taken further along than the previous. As in Eppstein's k
+    shortest paths algorithm, the sidetracks reachable along the tree path from j are kept in a persistent leftist
+    heap H(j), built from H of the next j on the tree path by adding the sidetrack at j (see merge_heaps). The plans are
+    then popped from a priority queue by their loss. The next candidates after a plan either replace its last sidetrack
+    with a child of it in the heap, or add the best sidetrack after it. A plan is written out by jumping straight from
+    one chosen site to the next with next_take, the first site the tree path from each j chooses, and from sidetrack
+    to sidetrack, so the skipped sites in between are never visited.
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    site_list: A list of revenues for each site.
+
+    :Output, return or postcondition:
+    A generator of (total revenue, list of chosen sites that are 1-indexed) tuples, one for each distinct plan
+
+    :Time complexity:
+    O(N log N) before the first plan, where N is the number of sites, then O(log k + K + T) for the k-th plan, where K
+    is its number of chosen sites and T its number of sidetracks, for the priority queue and for writing out the plan.
+
+    :Aux space complexity:
+    O(N log N + k)
+    """
+    N = len(site_list)
+    best = [0]*(N+1)  # best[j] is the best total of the first j sites
+    tree_take = array('b', bytes(N+1))
+    for j in range(1, N+1):
+        include_site = site_list[j-1] + best[max(j-d-1, 0)]
+        if include_site > best[j-1]:
+            best[j] = include_site
+            tree_take[j] = 1
+        else:
+            best[j] = best[j-1]
+
+    # heaps[j] holds the sidetracks on the tree path from j, keyed by the revenue they lose
+    heaps = [None]*(N+1)
+    for j in range(1, N+1):
+        skip_loss = best[j] - best[j-1]
+        take_loss = best[j] - site_list[j-1] - best[max(j-d-1, 0)]
+        if tree_take[j]:
+            heaps[j] = merge_heaps((skip_loss, j, None, None, 1), heaps[max(j-d-1, 0)])
+        else:
+            heaps[j] = merge_heaps((take_loss, j, None, None, 1), heaps[j-1])
+
+    # next_take[j] is the first site the tree path from j chooses, 0 if it chooses none
+    next_take = array('q', bytes(8*(N+1)))
+    for j in range(1, N+1):
+        next_take[j] = j if tree_take[j] else next_take[j-1]
+
+    def plan(sidetracks: Optional[tuple]) -> List[int]:
+        # The sidetracks are linked from the last one taken, which is the one furthest along
+        detours = []
+        while sidetracks is not None:
+            detours.append(sidetracks[0])
+            sidetracks = sidetracks[1]
+        sites = []
+        j = N
+        while j > 0:
+            site = next_take[j]
+            if detours and site <= detours[-1]:  # the next sidetrack comes first
+                site = detours.pop()
+                if tree_take[site]:  # the sidetrack skips a site the tree path chooses
+                    j = site-1
+                    continue
+            elif site == 0:
+                break
+            sites.append(site)
+            j = max(site-d-1, 0)
+        sites.reverse()
+        return sites
+
+    yield (best[N], plan(None))
+
+    counter = itertools.count()
+    queue = []
+    if heaps[N] is not None:
+        queue.append((heaps[N][0], next(counter), heaps[N], None))
+    while queue:
+        loss, _, node, sidetracks = heapq.heappop(queue)
+        key, j, left, right, _ = node
+        taken_sidetracks = (j, sidetracks)
+        yield (best[N] - loss, plan(taken_sidetracks))
+
+        for child in (left, right):
+            if child is not None:
+                heapq.heappush(queue, (loss - key + child[0], next(counter), child, sidetracks))
+        after = j-1 if tree_take[j] else max(j-d-1, 0)
+        if heaps[after] is not None:
+            heapq.heappush(queue, (loss + heaps[after][0], next(counter), heaps[after], taken_sidetracks))
+
+
+def restaurantFinder_budget(d: int, site_list: List[int], costs: List[int], budget: int) -> Tuple[int, List[int]]:
+    """
+    Function description:
+    Same as restaurantFinder, but opening each site has a cost and the total cost of the chosen sites can be at most
+    budget.
+
+    Approach description:
+    The recurrence of restaurantFinder gets a budget dimension: the best total revenue up to site i with a total cost
+    of at most b is the better of excluding site i (the total up to site i-1 with budget b) and including it (its
+    revenue plus the total up to site i-d-1 with budget b minus its cost). For each site, the whole budget axis
+    0..budget is updated with NumPy vector operations. Like restaurantFinder_batch, only a ring buffer of the last d+1
+    rows of totals is kept, and the include/exclude decisions of each row are packed into bits. The chosen sites are
+    rebuilt by walking back from the last site with the full budget, taking off the cost of every included site.
+    Revenues whose totals could pass 2^63 are kept as Python ints (see numpy_revenues).
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    site_list: A list of revenues for each site.
+    costs: A list of non-negative integer opening costs for each site.
+    budget: int, the largest total cost of the chosen sites
+
+    :Output, return or postcondition:
+    A tuple with the maximum total revenue within the budget and a list of the chosen sites that are 1-indexed.
+
+    :Time complexity:
+    O(N * B), done in O(N) vectorised steps, where N is the number of sites and B is the budget.
+
+    :Aux space complexity:
+    O(min(d, N) * B + N * B / 8)
+    """
+    if np is None:
+        raise ImportError("restaurantFinder_budget requires NumPy")
+    if len(costs) != len(site_list):
+        raise ValueError("site_list and costs must have the same length")
+    revenues = numpy_revenues(site_list)
+    N = len(site_list)
+
+    window = np.zeros((min(d+1, N), budget+1), dtype=revenues.dtype)
+    taken = np.zeros((N, (budget+8) // 8), dtype=np.uint8)
+    previous = np.zeros(budget+1, dtype=revenues.dtype)
+    take = np.zeros(budget+1, dtype=bool)
+
+    for i in range(N):
+        slot = i % (d+1)
+        cost = costs[i]
+        current = previous.copy()
+        if cost <= budget:
+            # Including site i with budget b leaves budget b - cost for the sites up to i-d-1
+            include_site = revenues[i] + (window[slot, :budget+1-cost] if i > d else 0)
+            take[:cost] = False
+            take[cost:] = include_site > previous[cost:]
+            current[cost:] = np.where(take[cost:], include_site, previous[cost:])
+            taken[i] = np.packbits(take)
+        window[slot] = current
+        previous = current
+
+    chosen_sites = []
+    remaining = budget
+    i = N-1
+    while i >= 0:
+        if taken[i, remaining >> 3] >> (7 - (remaining & 7)) & 1:
+            chosen_sites.append(i+1)  # Convert to 1-indexed sites
+            remaining -= costs[i]
+            i -= d+1
+        else:
+            i -= 1
+    chosen_sites.reverse()
+
+    return (previous[budget:].tolist()[0], chosen_sites)
+
+
+def restaurantFinder_sparse(d: int, sites: List[Tuple[int, int]], length: int) -> Tuple[int, List[int]]:
+    """
+    Function description:
+    Same as restaurantFinder, but only the sites with a positive revenue are given, as (site number, revenue) pairs,
+    together with the number of sites in the corridor. All other sites have a revenue of 0 or less.
+
+    Approach description:
+    restaurantFinder never chooses a site with a revenue of 0 or less, because including it is never strictly better
+    than excluding it, so the total revenue stays the same across those sites. The positive sites are therefore solved
+    on their own with restaurantFinder_positions, using the site numbers as positions. Its pointer to the last site more
+    than d sites back plays the part of the site d+1 positions back, so the result is identical to restaurantFinder on
+    the dense site_list.
+
+    :Input:
+    d: The minimum distance between any two chosen sites.
+    sites: A list of (1-indexed site number, revenue) pairs with distinct site numbers, in any order. Pairs with a
+    revenue of 0 or less are ignored.
+    length: int, the number of sites in the corridor
+
+    :Output, return or postcondition:
+    The same tuple as restaurantFinder on the dense site_list of the corridor.
+
+    :Time complexity:
+    O(K log K), where K is the number of given sites, O(K) if they are sorted by site number.
+
+    :Aux space complexity:
+    O(K)
+    """
+    positive_sites = []
+    for site, revenue in sites:
+        if not 1 <= site <= length:
+            raise IndexError("site number out of range")
+        if revenue > 0:
+            positive_sites.append((site, revenue))
+    total_revenue, chosen = restaurantFinder_positions(d, positive_sites)
+    return (total_revenue, [positive_sites[k-1][0] for k in chosen])
+
+
+def restaurantFinder_radii(site_list: List[int], radii: List[int]) -> Tuple[int, List[int]]:
+    """
+    Function description:
+    Same as restaurantFinder, but every site has its own exclusion radius instead of one d for all sites. Two chosen
+    sites i and j must be more than the larger of their two radii apart.
+
+    Approach description:
+    If every two consecutive chosen sites are far enough apart, so is every pair: for chosen sites a < b < c, c is
+    further from a than b is, and b is already more than the radius of a away. So the best plan ending with site i
+    is its revenue plus the best plan ending with a site j with j < i - radii[i] and j + radii[j] < i, or just its
+    revenue. The sites are processed from left to right. Site j is added to a Fenwick tree of prefix maximums over
+    the site index once i passes j + radii[j], so the condition j < i - radii[i] is one prefix query.
+
+    :Input:
+    site_list: A list of revenues for each site.
+    radii: A list of non-negative integer exclusion radii for each site.
+
+    :Output, return or postcondition:
+    A tuple with the maximum total revenue and a list of the chosen sites that are 1-indexed. With every radius equal
+    to d, the total revenue is the same as restaurantFinder(d, site_list).
+
+    :Time complexity:
+    O(N log N), where N is the number of sites.
+
+    :Aux space complexity:
+    O(N)
+    """
+    N = len(site_list)
+    if len(radii) != N:
+        raise ValueError("site_list and radii must have the same length")
+    tree = [(0, -1)]*(N+1)  # Fenwick tree of (best plan ending at j, j) prefix maximums, 1-indexed
+    activated_at = [[] for _ in range(N)]
+    ending_at = [0]*N
+    previous_site = array('q', bytes(8*N))
+    best = (0, -1)
+
+    for i in range(N):
+        for j in activated_at[i]:
+            k = j + 1
+            while k <= N:
+                if ending_at[j] > tree[k][0]:
+                    tree[k] = (ending_at[j], j)
+                k += k & -k
+
+        earlier = (0, -1)
+        k = i - radii[i]  # sites 0 to i - radii[i] - 1, that is the first i - radii[i] sites
+        while k > 0:
+            if tree[k][0] > earlier[0]:
+                earlier = tree[k]
+            k -= k & -k
+        ending_at[i] = site_list[i] + earlier[0]
+        previous_site[i] = earlier[1]
+        if ending_at[i] > best[0]:
+            best = (ending_at[i], i)
+
+        if i + radii[i] + 1 < N:
+            activated_at[i + radii[i] + 1].append(i)
+
+    chosen_sites = []
+    i = best[1]
+    while i >= 0:
+        chosen_sites.append(i+1)  # Convert to 1-indexed sites
+        i = previous_site[i]
+    chosen_sites.reverse()
+
+    return (best[0], chosen_sites)